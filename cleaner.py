@@ -9,9 +9,8 @@ import os
 import shutil
 import stat
 import time
-import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
-from pathlib import Path
 from typing import List, Tuple
 
 from rich.progress import Progress, BarColumn, TextColumn, TimeRemainingColumn
@@ -56,7 +55,11 @@ def clean(
 
     clean_start = time.perf_counter()
 
-    with Progress(
+    # Deletions run on one reusable worker thread so the progress bar timing
+    # keeps ticking while a large item is being deleted.
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SysCleanDelete")
+
+    with executor, Progress(
         TextColumn("[bold blue]{task.description}"),
         BarColumn(bar_width=40),
         TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
@@ -71,30 +74,11 @@ def clean(
             error_msg = ""
             item_start = time.perf_counter()
 
-            # Run deletion in background thread so we can update the
-            # progress bar timing while a large item is being deleted.
-            result_holder: dict = {}
-
-            def _do_delete(itm=item):
-                try:
-                    if itm.item_type == ItemType.COMMAND:
-                        result_holder["ok"] = _run_cleanup_command(itm.path)
-                    elif itm.item_type == ItemType.REGISTRY_KEY:
-                        result_holder["ok"] = _delete_registry_key(itm.path)
-                    elif itm.item_type == ItemType.FILE:
-                        result_holder["ok"] = _delete_file(itm.path)
-                    elif itm.item_type == ItemType.DIRECTORY:
-                        result_holder["ok"] = _delete_directory(itm.path)
-                except Exception as exc:
-                    result_holder["ok"] = False
-                    result_holder["err"] = str(exc)
-
-            worker = threading.Thread(target=_do_delete, daemon=True)
-            worker.start()
-
-            # Poll every 0.5 s so the timer keeps ticking
-            while worker.is_alive():
-                worker.join(timeout=0.5)
+            future = executor.submit(_delete_item, item)
+
+            # Wake every 0.5 s so the timer keeps ticking; returns as soon
+            # as the deletion finishes
+            while not wait((future,), timeout=0.5).done:
                 elapsed = time.perf_counter() - clean_start
                 done = i  # not yet completed
                 avg_per_item = elapsed / max(done, 1)
@@ -103,8 +87,10 @@ def clean(
                               f"ETA {_format_duration(remaining_est)}")
                 progress.update(task, completed=i, timing=timing_str)
 
-            success = result_holder.get("ok", False)
-            error_msg = result_holder.get("err", "")
+            try:
+                success = future.result()
+            except Exception as exc:
+                error_msg = str(exc)
 
             if success:
                 deleted += 1
@@ -143,6 +129,19 @@ def clean(
     return deleted, failed, freed, log_path, total_duration
 
 
+def _delete_item(item: CleanupItem) -> bool:
+    """Delete one item with the handler for its type."""
+    if item.item_type == ItemType.COMMAND:
+        return _run_cleanup_command(item.path)
+    if item.item_type == ItemType.REGISTRY_KEY:
+        return _delete_registry_key(item.path)
+    if item.item_type == ItemType.FILE:
+        return _delete_file(item.path)
+    if item.item_type == ItemType.DIRECTORY:
+        return _delete_directory(item.path)
+    return False
+
+
 def _delete_file(path: str) -> bool:
     """Delete a single file, handling read-only attributes."""
     if not os.path.isfile(path):
@@ -9,11 +9,12 @@ Provides:
 
 from __future__ import annotations
 
+import fnmatch
 import json
 import os
+import re
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Callable, Dict, List, Optional, Set
 
 CONFIG_DIR = os.path.join(os.environ.get("APPDATA", "."), "SysClean")
 CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
@@ -150,22 +151,36 @@ def save_exclusions(config: ExclusionConfig) -> None:
 
 
 def is_excluded(path: str, exclusions: ExclusionConfig) -> bool:
-    """Check if a path matches any exclusion rule."""
-    import fnmatch
-
-    path_lower = os.path.normpath(path).lower()
-
-    # Check exact path matches
-    for excl in exclusions.paths:
-        if os.path.normpath(excl).lower() == path_lower:
-            return True
-
-    # Check glob patterns
-    for pattern in exclusions.patterns:
-        if fnmatch.fnmatch(path_lower, pattern.lower()):
+    """
+    Check if a path matches any exclusion rule.
+
+    When checking many paths against the same config, build the matcher
+    once with compile_exclusions instead.
+    """
+    return compile_exclusions(exclusions)(path)
+
+
+def compile_exclusions(exclusions: ExclusionConfig) -> Callable[[str], bool]:
+    """
+    Return a `matcher(path) -> bool` equivalent to is_excluded.
+
+    Exact paths are normalized once into a set, and all glob patterns are
+    combined into a single compiled regex, so each check is one set lookup
+    plus one regex match regardless of how many exclusions are configured.
+    """
+    excluded_paths = frozenset(os.path.normpath(p).lower() for p in exclusions.paths)
+    # fnmatch.fnmatch normcases both sides before matching; do the pattern
+    # side here once
+    translated = [fnmatch.translate(os.path.normcase(p.lower())) for p in exclusions.patterns]
+    pattern_match = re.compile("|".join(translated)).match if translated else None
+
+    def matcher(path: str) -> bool:
+        path_lower = os.path.normpath(path).lower()
+        if path_lower in excluded_paths:
             return True
+        return pattern_match is not None and pattern_match(os.path.normcase(path_lower)) is not None
 
-    return False
+    return matcher
 
 
 # ── General Config ───────────────────────────────────────────────────────────
@@ -12,12 +12,12 @@ Usage:
     python main.py --profile frontend   Use a cleanup profile
     python main.py --min-age 7          Only target files older than 7 days
     python main.py --exclude C:\\Keep    Exclude a path from cleanup
+    python main.py --debug              Show full tracebacks for failed scans
 """
 
 from __future__ import annotations
 
 import argparse
-import ctypes
 import os
 import sys
 import time
@@ -39,14 +39,6 @@ BANNER = r"""
 """
 
 
-def is_admin() -> bool:
-    """Check if the script is running with administrator privileges."""
-    try:
-        return ctypes.windll.shell32.IsUserAnAdmin() != 0
-    except Exception:
-        return False
-
-
 def request_elevation() -> None:
     """Show message about needing admin rights."""
     console.print(Panel(
@@ -115,6 +107,11 @@ def parse_args() -> argparse.Namespace:
         metavar="PATH",
         help="Paths to exclude from cleanup",
     )
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="Record full tracebacks for rules that fail to scan",
+    )
     parser.add_argument(
         "--list-profiles",
         action="store_true",
@@ -139,6 +136,7 @@ def main() -> int:
         return 0
 
     # Check admin
+    from rules._fsutil import is_admin
     if not is_admin():
         request_elevation()
         console.print("\n[dim]Running in limited mode -- some system directories may be inaccessible.[/]\n")
@@ -162,7 +160,7 @@ def main() -> int:
             console.print(f"[red]Unknown profile '{args.profile}'. "
                           f"Use --list-profiles to see options.[/]")
             return 1
-        profile_rules = set(profile.rules)
+        profile_rules = frozenset(profile.rules)
         console.print(f"[cyan]Using profile: [bold]{profile.name}[/] — {profile.description}[/]")
         # If profile includes registry, auto-enable it
         if "registry" in profile_rules:
@@ -207,6 +205,7 @@ def main() -> int:
             include_registry=args.include_registry,
             progress_cb=on_progress,
             profile_rules=profile_rules,
+            debug=args.debug,
         )
         from models import _format_duration
         progress.update(task, description="Done!",
@@ -246,10 +245,10 @@ def main() -> int:
     # -- AUTO MODE --
     if args.auto:
         console.print("[yellow]Auto mode: all items selected for deletion.[/]")
+        # Items are created selected and auto mode skips the review step,
+        # so only the categories need enabling
         for cat in result.categories:
             cat.enabled = True
-            for item in cat.items:
-                item.selected = True
 
         from cleaner import clean
         deleted, failed, freed, log_path, clean_duration = clean(result, log_dir=args.log_dir)
@@ -289,10 +288,11 @@ def main() -> int:
 def _apply_filters(result, args, exclusions) -> None:
     """Apply age-based filtering and exclusion rules to scan results."""
     import time as _time
-    from config import is_excluded
+    from config import compile_exclusions
 
     min_age_seconds = args.min_age * 86400 if args.min_age > 0 else 0
     cutoff = _time.time() - min_age_seconds if min_age_seconds > 0 else 0
+    is_excluded = compile_exclusions(exclusions)
 
     for cat in result.categories:
         if not cat.items:
@@ -301,7 +301,7 @@ def _apply_filters(result, args, exclusions) -> None:
         filtered = []
         for item in cat.items:
             # Check exclusions
-            if is_excluded(item.path, exclusions):
+            if is_excluded(item.path):
                 continue
 
             # Check age filter (only for files/directories, not registry)
@@ -321,6 +321,7 @@ def _apply_filters(result, args, exclusions) -> None:
 def _show_scan_timing(result) -> None:
     """Show a table of time spent per scan rule with totals."""
     from rich.table import Table
+    from rich.text import Text
     from rich import box
     from models import _format_duration, _format_size
 
@@ -346,19 +347,21 @@ def _show_scan_timing(result) -> None:
         pct = (cat.scan_duration_s / total_dur) * 100
         time_style = "bold red" if pct > 30 else ("yellow" if pct > 15 else "green")
 
+        # Plain Text cells: no markup to parse per row
+        time_cell = Text(_format_duration(cat.scan_duration_s), style=time_style)
+        pct_cell = Text(f"{pct:.1f}%", style=time_style)
+
         if cat.scan_error:
             table.add_row(
-                str(idx), cat.name, "ERR", "-",
-                f"[{time_style}]{_format_duration(cat.scan_duration_s)}[/]",
-                f"[{time_style}]{pct:.1f}%[/]",
+                Text(str(idx)), Text(cat.name), Text("ERR"), Text("-"),
+                time_cell, pct_cell,
             )
         else:
             table.add_row(
-                str(idx), cat.name,
-                f"{cat.item_count:,}",
-                cat.total_size_human,
-                f"[{time_style}]{_format_duration(cat.scan_duration_s)}[/]",
-                f"[{time_style}]{pct:.1f}%[/]",
+                Text(str(idx)), Text(cat.name),
+                Text(f"{cat.item_count:,}"),
+                Text(cat.total_size_human),
+                time_cell, pct_cell,
             )
 
     # Totals row
@@ -376,10 +379,19 @@ def _show_scan_timing(result) -> None:
     console.print()
 
 
-def _show_detailed_scan(result) -> None:
-    """Show a detailed breakdown of all scan results (scan-only mode)."""
+def _make_item_table():
+    """Empty headerless Path/Size table used by the detailed scan listing."""
     from rich.table import Table
     from rich import box
+
+    table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
+    table.add_column("Path", max_width=75)
+    table.add_column("Size", justify="right", width=12)
+    return table
+
+
+def _show_detailed_scan(result) -> None:
+    """Show a detailed breakdown of all scan results (scan-only mode)."""
     from models import _format_size
 
     for cat in result.categories:
@@ -392,18 +404,14 @@ def _show_detailed_scan(result) -> None:
                       f"{cat.item_count:,} items, {cat.total_size_human}")
 
         if cat.item_count <= 20:
-            table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
-            table.add_column("Path", max_width=75)
-            table.add_column("Size", justify="right", width=12)
+            table = _make_item_table()
             for item in cat.items:
                 table.add_row(item.path, item.size_human)
             console.print(table)
         else:
             # Show top 10 largest items
             sorted_items = sorted(cat.items, key=lambda x: x.size, reverse=True)
-            table = Table(box=box.SIMPLE, show_header=False, padding=(0, 1))
-            table.add_column("Path", max_width=75)
-            table.add_column("Size", justify="right", width=12)
+            table = _make_item_table()
             for item in sorted_items[:10]:
                 table.add_row(item.path, item.size_human)
             console.print(table)
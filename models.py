@@ -6,8 +6,7 @@ from __future__ import annotations
 
 import enum
 from dataclasses import dataclass, field
-from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 
 class RiskLevel(enum.Enum):
@@ -26,7 +25,7 @@ class ItemType(enum.Enum):
     COMMAND = "command"          # Cleanup via subprocess (e.g. DISM, pnputil)
 
 
-@dataclass
+@dataclass(slots=True)
 class CleanupItem:
     """A single file, folder, or registry key eligible for cleanup."""
     path: str                           # Full path or registry key path
@@ -40,15 +39,7 @@ class CleanupItem:
     @property
     def size_human(self) -> str:
         """Return human-readable file size."""
-        if self.size <= 0:
-            return "0 B"
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(self.size)
-        idx = 0
-        while size >= 1024.0 and idx < len(units) - 1:
-            size /= 1024.0
-            idx += 1
-        return f"{size:.1f} {units[idx]}"
+        return _format_size(self.size)
 
 
 @dataclass
@@ -61,14 +52,62 @@ class CleanupCategory:
     enabled: bool = True        # User can toggle entire category
     scan_error: Optional[str] = None  # Error message if scan failed
     scan_duration_s: float = 0.0       # Time taken to scan this category (seconds)
+    # (items list, its length, total size, formatted total size)
+    _size_cache: Optional[Tuple[List[CleanupItem], int, int, str]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # (items list, its length, selected count, selected size, formatted
+    # selected size), cleared by invalidate_selection()
+    _selection_cache: Optional[Tuple[List[CleanupItem], int, int, int, str]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    def _size_totals(self) -> Tuple[List[CleanupItem], int, int, str]:
+        # Item sizes are fixed once scanned, so the sum only goes stale when
+        # items are added (length changes) or the list is replaced (identity
+        # changes, e.g. post-scan filtering). Holding the list reference
+        # rules out a false hit from a recycled id().
+        items = self.items
+        cache = self._size_cache
+        if cache is None or cache[0] is not items or cache[1] != len(items):
+            total = sum(item.size for item in items)
+            cache = (items, len(items), total, _format_size(total))
+            self._size_cache = cache
+        return cache
 
     @property
     def total_size(self) -> int:
-        return sum(item.size for item in self.items)
+        return self._size_totals()[2]
+
+    def selection_totals(self) -> Tuple[int, int]:
+        """
+        Return (selected_count, selected_size) from a single pass over items.
+
+        Cached like total_size; code that flips item.selected must call
+        invalidate_selection() afterwards.
+        """
+        cache = self._selection_totals()
+        return cache[2], cache[3]
+
+    def _selection_totals(self) -> Tuple[List[CleanupItem], int, int, int, str]:
+        items = self.items
+        cache = self._selection_cache
+        if cache is None or cache[0] is not items or cache[1] != len(items):
+            count = 0
+            size = 0
+            for item in items:
+                if item.selected:
+                    count += 1
+                    size += item.size
+            cache = (items, len(items), count, size, _format_size(size))
+            self._selection_cache = cache
+        return cache
+
+    def invalidate_selection(self) -> None:
+        """Drop the cached selection totals after item.selected changes."""
+        self._selection_cache = None
 
     @property
     def selected_size(self) -> int:
-        return sum(item.size for item in self.items if item.selected)
+        return self.selection_totals()[1]
 
     @property
     def item_count(self) -> int:
@@ -76,15 +115,15 @@ class CleanupCategory:
 
     @property
     def selected_count(self) -> int:
-        return sum(1 for item in self.items if item.selected)
+        return self.selection_totals()[0]
 
     @property
     def total_size_human(self) -> str:
-        return _format_size(self.total_size)
+        return self._size_totals()[3]
 
     @property
     def selected_size_human(self) -> str:
-        return _format_size(self.selected_size)
+        return self._selection_totals()[4]
 
 
 @dataclass
@@ -92,6 +131,8 @@ class ScanResult:
     """Aggregated result of a full system scan."""
     categories: List[CleanupCategory] = field(default_factory=list)
     total_scan_duration_s: float = 0.0  # Total wall-clock time for the scan
+    # Enabled, error-free categories, in scan order; kept by the category prompt
+    enabled_categories: List[CleanupCategory] = field(default_factory=list)
 
     @property
     def total_size(self) -> int:
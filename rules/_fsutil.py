@@ -0,0 +1,229 @@
+"""
+SysClean — Shared filesystem helpers for rule modules.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+from ctypes import wintypes
+from functools import lru_cache
+from typing import AbstractSet, Iterable, Iterator, List, Tuple
+
+from models import CleanupCategory, CleanupItem, ItemType, RiskLevel
+
+# Well-known Windows locations, resolved once per process
+WINDIR = os.environ.get("SYSTEMROOT", r"C:\Windows")
+PROGRAMDATA = os.environ.get("PROGRAMDATA", r"C:\ProgramData")
+USERPROFILE = os.environ.get("USERPROFILE", "")
+APPDATA = os.environ.get("APPDATA", "")
+LOCALAPPDATA = os.environ.get("LOCALAPPDATA", "")
+
+# GET_FILEEX_INFO_LEVELS.GetFileExInfoStandard
+_GET_FILE_EX_INFO_STANDARD = 0
+
+
+class _Win32FileAttributeData(ctypes.Structure):
+    _fields_ = [
+        ("dwFileAttributes", wintypes.DWORD),
+        ("ftCreationTime", wintypes.FILETIME),
+        ("ftLastAccessTime", wintypes.FILETIME),
+        ("ftLastWriteTime", wintypes.FILETIME),
+        ("nFileSizeHigh", wintypes.DWORD),
+        ("nFileSizeLow", wintypes.DWORD),
+    ]
+
+
+try:
+    _GetFileAttributesExW = ctypes.windll.kernel32.GetFileAttributesExW
+    _GetFileAttributesExW.argtypes = [wintypes.LPCWSTR, ctypes.c_int, ctypes.c_void_p]
+    _GetFileAttributesExW.restype = wintypes.BOOL
+except AttributeError:  # not on Windows
+    _GetFileAttributesExW = None
+
+
+@lru_cache(maxsize=1)
+def is_admin() -> bool:
+    """
+    Check if the process is running with administrator privileges.
+
+    Elevation cannot change while the process runs, so the answer is
+    computed once and shared by main.py and the rules that need it.
+    """
+    try:
+        return ctypes.windll.shell32.IsUserAnAdmin() != 0
+    except Exception:
+        return False
+
+
+def fast_file_size(path: str) -> int:
+    """
+    Size of a single file in bytes via GetFileAttributesExW, which reads the
+    size from the directory entry without opening the file.
+
+    Falls back to os.path.getsize (and its OSError) when the API is
+    unavailable or the call fails.
+    """
+    if _GetFileAttributesExW is not None:
+        data = _Win32FileAttributeData()
+        if _GetFileAttributesExW(path, _GET_FILE_EX_INFO_STANDARD, ctypes.byref(data)):
+            return (data.nFileSizeHigh << 32) | data.nFileSizeLow
+    return os.path.getsize(path)
+
+
+def dir_size(path: str) -> int:
+    """
+    Recursively calculate directory size in bytes, handling permission errors.
+
+    Results are cached per (path, mtime) until clear_dir_size_cache(), so a
+    directory sized by several rules is only walked once. The key uses the
+    root directory's mtime, which only changes when direct children are
+    added or removed; changes deeper in the tree are missed, which is why
+    scan_all clears the cache at the start of every scan.
+
+    Missing paths and non-directories size as 0, so callers that only keep
+    non-empty results need no separate os.path.isdir check.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except (OSError, PermissionError):
+        return 0
+    return _cached_dir_size(path, mtime_ns)
+
+
+def clear_dir_size_cache() -> None:
+    """Forget all cached dir_size results."""
+    _cached_dir_size.cache_clear()
+
+
+def add_dir_item(category: CleanupCategory, dir_path: str, label: str,
+                 risk: RiskLevel) -> None:
+    """Add `dir_path` to the category as one directory item if it is non-empty."""
+    size = dir_size(dir_path)
+    if size > 0:
+        category.items.append(CleanupItem(
+            path=dir_path,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.DIRECTORY,
+            description=label,
+        ))
+
+
+def find_project_roots(userprofile: str, candidates: Iterable[str]) -> List[str]:
+    """
+    Return the `candidates` folder names that exist under the user profile,
+    as full paths in candidate order.
+
+    A single scandir of the profile replaces one isdir probe per candidate.
+    Names are compared case-insensitively, matching NTFS semantics. Junctions
+    and symlinks are followed, since project folders are often junctioned to
+    another drive, and two candidates resolving to the same folder are only
+    returned once.
+    """
+    present = {}
+    try:
+        with os.scandir(userprofile) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir():
+                        present[entry.name.lower()] = entry.path
+                except (OSError, PermissionError):
+                    pass
+    except (OSError, PermissionError):
+        return []
+
+    roots: List[str] = []
+    seen = set()
+    for candidate in candidates:
+        path = present.get(candidate.lower())
+        if path is None:
+            continue
+        real_path = os.path.normcase(os.path.realpath(path))
+        if real_path in seen:
+            continue
+        seen.add(real_path)
+        roots.append(path)
+    return roots
+
+
+def walk_project_tree(root: str, max_depth: int,
+                      skip_dirs: AbstractSet[str]) -> Iterator[Tuple[str, List[str], List[str]]]:
+    """
+    Walk a project tree top-down, yielding os.walk's (dirpath, dirnames,
+    filenames) triples.
+
+    The caller sees each directory's dirnames before pruning and may remove
+    entries from it (e.g. a cache folder it has just recorded). After that,
+    dot-prefixed names (.git, .venv, ...) and names in `skip_dirs` are not
+    descended into, and nothing deeper than `max_depth` levels below `root`
+    is visited. os.walk builds every dirpath as root + sep + name, so the
+    depth is the separator count beyond the root's own, and callers can
+    join children with dirpath + os.sep + name.
+    """
+    root_seps = root.count(os.sep)
+    try:
+        for dirpath, dirnames, filenames in os.walk(root):
+            yield dirpath, dirnames, filenames
+
+            if dirpath.count(os.sep) - root_seps >= max_depth:
+                dirnames.clear()
+            else:
+                dirnames[:] = [d for d in dirnames
+                               if d[:1] != "." and d not in skip_dirs]
+    except (OSError, PermissionError):
+        pass
+
+
+@lru_cache(maxsize=256)
+def _cached_dir_size(path: str, mtime_ns: int) -> int:
+    return _dir_size_impl(path)
+
+
+def _dir_size_impl(path: str) -> int:
+    return sum(size for _entry, size in walk_files(path))
+
+
+def _list_dir(path: str) -> Tuple[List[Tuple[os.DirEntry, int]], List[str]]:
+    """
+    List one directory as ([(file entry, size), ...], [subdirectory path, ...]).
+
+    All OSError/PermissionError handling for the walk lives here: an
+    unreadable directory lists as empty and an entry that cannot be
+    stat'ed is left out, so walk_files consumers need no try blocks.
+    """
+    files: List[Tuple[os.DirEntry, int]] = []
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        files.append((entry, entry.stat(follow_symlinks=False).st_size))
+                except (OSError, PermissionError):
+                    pass
+    except (OSError, PermissionError):
+        pass
+    return files, subdirs
+
+
+def walk_files(root: str) -> Iterator[Tuple[os.DirEntry, int]]:
+    """
+    Yield (DirEntry, size) for every non-directory below `root`.
+
+    Directories are listed with os.scandir from an explicit stack on the
+    calling thread. A walk starts no threads of its own: up to
+    MAX_SCAN_WORKERS rules already run on the scanner's pool, which keeps
+    several scandir calls in flight, and a pool per walk would multiply
+    the thread count for every dir_size call. Symlinked/junctioned
+    directories are not descended into. Unreadable directories and
+    entries are skipped silently.
+    """
+    stack = [root]
+    while stack:
+        files, subdirs = _list_dir(stack.pop())
+        yield from files
+        stack.extend(subdirs)
@@ -6,14 +6,36 @@ from __future__ import annotations
 
 import os
 import glob
-from pathlib import Path
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    dir_size as _dir_size,
+    WINDIR as _WINDIR,
+    APPDATA as _APPDATA,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "caches"
 display_name = "Caches (Thumbnails, Fonts, Browsers)"
 description = "Thumbnail cache, font cache, and browser caches (Chrome, Edge, Firefox)"
 risk = RiskLevel.SAFE
 
+_EXPLORER_DIR = os.path.join(_LOCALAPPDATA, "Microsoft", "Windows", "Explorer")
+_FONT_CACHE_DIR = os.path.join(
+    _WINDIR, "ServiceProfiles", "LocalService", "AppData", "Local", "FontCache"
+)
+_FIREFOX_PROFILES = os.path.join(_LOCALAPPDATA, "Mozilla", "Firefox", "Profiles")
+
+# Browser cache locations: (label, absolute path under LOCALAPPDATA)
+_BROWSER_CACHES = [
+    (label, os.path.join(_LOCALAPPDATA, rel_path))
+    for label, rel_path in (
+        # ("Chrome cache", os.path.join("Google", "Chrome", "User Data", "Default", "Cache")),
+        # ("Chrome Code Cache", os.path.join("Google", "Chrome", "User Data", "Default", "Code Cache")),
+        ("Edge cache", os.path.join("Microsoft", "Edge", "User Data", "Default", "Cache")),
+        ("Edge Code Cache", os.path.join("Microsoft", "Edge", "User Data", "Default", "Code Cache")),
+    )
+]
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -32,21 +54,16 @@ def scan() -> CleanupCategory:
 # ── Thumbnail cache ──────────────────────────────────────────────────────────
 
 def _scan_thumbnail_cache(category: CleanupCategory) -> None:
-    local_app = os.environ.get("LOCALAPPDATA", "")
-    if not local_app:
-        return
-
-    explorer_dir = os.path.join(local_app, "Microsoft", "Windows", "Explorer")
-    if not os.path.isdir(explorer_dir):
+    if not _LOCALAPPDATA or not os.path.isdir(_EXPLORER_DIR):
         return
 
     try:
-        for entry in os.scandir(explorer_dir):
+        for entry in os.scandir(_EXPLORER_DIR):
             try:
                 if entry.is_file(follow_symlinks=False) and "thumbcache" in entry.name.lower():
                     category.items.append(CleanupItem(
                         path=entry.path,
-                        size=entry.stat().st_size,
+                        size=entry.stat(follow_symlinks=False).st_size,
                         category=category.name,
                         risk=RiskLevel.SAFE,
                         item_type=ItemType.FILE,
@@ -61,21 +78,16 @@ def _scan_thumbnail_cache(category: CleanupCategory) -> None:
 # ── Font cache ───────────────────────────────────────────────────────────────
 
 def _scan_font_cache(category: CleanupCategory) -> None:
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    font_cache_dir = os.path.join(
-        windir, "ServiceProfiles", "LocalService", "AppData", "Local", "FontCache"
-    )
-
-    if not os.path.isdir(font_cache_dir):
+    if not os.path.isdir(_FONT_CACHE_DIR):
         return
 
     try:
-        for entry in os.scandir(font_cache_dir):
+        for entry in os.scandir(_FONT_CACHE_DIR):
             try:
                 if entry.is_file(follow_symlinks=False):
                     category.items.append(CleanupItem(
                         path=entry.path,
-                        size=entry.stat().st_size,
+                        size=entry.stat(follow_symlinks=False).st_size,
                         category=category.name,
                         risk=RiskLevel.LOW,
                         item_type=ItemType.FILE,
@@ -90,65 +102,37 @@ def _scan_font_cache(category: CleanupCategory) -> None:
 # ── Browser caches ───────────────────────────────────────────────────────────
 
 def _scan_browser_caches(category: CleanupCategory) -> None:
-    local_app = os.environ.get("LOCALAPPDATA", "")
-    if not local_app:
+    if not _LOCALAPPDATA:
         return
 
-    # Browser cache locations: (label, relative path from LOCALAPPDATA)
-    browser_caches = [
-        # ("Chrome cache", os.path.join("Google", "Chrome", "User Data", "Default", "Cache")),
-        # ("Chrome Code Cache", os.path.join("Google", "Chrome", "User Data", "Default", "Code Cache")),
-        ("Edge cache", os.path.join("Microsoft", "Edge", "User Data", "Default", "Cache")),
-        ("Edge Code Cache", os.path.join("Microsoft", "Edge", "User Data", "Default", "Code Cache")),
-    ]
-
-    for label, rel_path in browser_caches:
-        cache_dir = os.path.join(local_app, rel_path)
-        if os.path.isdir(cache_dir):
-            size = _dir_size(cache_dir)
-            if size > 0:
-                category.items.append(CleanupItem(
-                    path=cache_dir,
-                    size=size,
-                    category=category.name,
-                    risk=RiskLevel.SAFE,
-                    item_type=ItemType.DIRECTORY,
-                    description=label,
-                ))
+    for label, cache_dir in _BROWSER_CACHES:
+        size = _dir_size(cache_dir)
+        if size > 0:
+            category.items.append(CleanupItem(
+                path=cache_dir,
+                size=size,
+                category=category.name,
+                risk=RiskLevel.SAFE,
+                item_type=ItemType.DIRECTORY,
+                description=label,
+            ))
 
     # Firefox — profile-based cache
-    appdata = os.environ.get("APPDATA", "")
-    if appdata:
-        ff_profiles = os.path.join(local_app, "Mozilla", "Firefox", "Profiles")
-        if os.path.isdir(ff_profiles):
+    if _APPDATA:
+        if os.path.isdir(_FIREFOX_PROFILES):
             try:
-                for profile_entry in os.scandir(ff_profiles):
+                for profile_entry in os.scandir(_FIREFOX_PROFILES):
                     if profile_entry.is_dir(follow_symlinks=False):
                         ff_cache = os.path.join(profile_entry.path, "cache2")
-                        if os.path.isdir(ff_cache):
-                            size = _dir_size(ff_cache)
-                            if size > 0:
-                                category.items.append(CleanupItem(
-                                    path=ff_cache,
-                                    size=size,
-                                    category=category.name,
-                                    risk=RiskLevel.SAFE,
-                                    item_type=ItemType.DIRECTORY,
-                                    description=f"Firefox cache ({profile_entry.name})",
-                                ))
+                        size = _dir_size(ff_cache)
+                        if size > 0:
+                            category.items.append(CleanupItem(
+                                path=ff_cache,
+                                size=size,
+                                category=category.name,
+                                risk=RiskLevel.SAFE,
+                                item_type=ItemType.DIRECTORY,
+                                description=f"Firefox cache ({profile_entry.name})",
+                            ))
             except (OSError, PermissionError):
                 pass
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
@@ -6,13 +6,21 @@ Scans the Delivery Optimization cache used for Windows Update distribution.
 from __future__ import annotations
 
 import os
-from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from models import CleanupCategory, RiskLevel
+from rules._fsutil import add_dir_item as _add_dir, WINDIR as _WINDIR
 
 name = "delivery_optimization"
 display_name = "Delivery Optimization Cache"
 description = "Windows Update Delivery Optimization peer-to-peer cache"
 risk = RiskLevel.SAFE
 
+# Primary location
+_DO_CACHE = os.path.join(_WINDIR, "SoftwareDistribution", "DeliveryOptimization")
+# Alternate location used by some builds
+_DO_NETWORK_CACHE = os.path.join(_WINDIR, "ServiceProfiles", "NetworkService",
+                                 "AppData", "Local", "Microsoft", "Windows",
+                                 "DeliveryOptimization", "Cache")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -21,45 +29,7 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-
-    # Primary location
-    do_cache = os.path.join(windir, "SoftwareDistribution", "DeliveryOptimization")
-    _add_dir_if_exists(category, do_cache, "Delivery Optimization cache")
-
-    # Alternate location used by some builds
-    do_cache2 = os.path.join(windir, "ServiceProfiles", "NetworkService",
-                             "AppData", "Local", "Microsoft", "Windows",
-                             "DeliveryOptimization", "Cache")
-    _add_dir_if_exists(category, do_cache2, "Delivery Optimization network cache")
+    _add_dir(category, _DO_CACHE, "Delivery Optimization cache", RiskLevel.SAFE)
+    _add_dir(category, _DO_NETWORK_CACHE, "Delivery Optimization network cache", RiskLevel.SAFE)
 
     return category
-
-
-def _add_dir_if_exists(category: CleanupCategory, dir_path: str, label: str) -> None:
-    if not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
-        category.items.append(CleanupItem(
-            path=dir_path,
-            size=size,
-            category=category.name,
-            risk=RiskLevel.SAFE,
-            item_type=ItemType.DIRECTORY,
-            description=label,
-        ))
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
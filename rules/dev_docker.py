@@ -8,6 +8,12 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    add_dir_item as _add_dir,
+    USERPROFILE as _USERPROFILE,
+    APPDATA as _APPDATA,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "dev_docker"
 display_name = "Docker Desktop Caches"
@@ -22,14 +28,10 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    localappdata = os.environ.get("LOCALAPPDATA", "")
-    appdata = os.environ.get("APPDATA", "")
-    userprofile = os.environ.get("USERPROFILE", "")
-
     # ── Docker Desktop WSL2 virtual disk ─────────────────────────────────
     # This is the main disk space consumer — the ext4.vhdx for Docker
-    if localappdata:
-        docker_wsl_data = os.path.join(localappdata, "Docker", "wsl", "data")
+    if _LOCALAPPDATA:
+        docker_wsl_data = os.path.join(_LOCALAPPDATA, "Docker", "wsl", "data")
         if os.path.isdir(docker_wsl_data):
             for fname in os.listdir(docker_wsl_data):
                 if fname.lower().endswith(".vhdx"):
@@ -49,18 +51,18 @@ def scan() -> CleanupCategory:
                         pass
 
     # ── Docker Desktop distro disk ───────────────────────────────────────
-    if localappdata:
-        docker_distro = os.path.join(localappdata, "Docker", "wsl", "distro")
+    if _LOCALAPPDATA:
+        docker_distro = os.path.join(_LOCALAPPDATA, "Docker", "wsl", "distro")
         _add_dir(category, docker_distro,
                  "Docker Desktop WSL distro data", RiskLevel.MEDIUM)
 
     # ── Docker Desktop cache/logs ────────────────────────────────────────
-    if localappdata:
-        docker_log = os.path.join(localappdata, "Docker", "log")
+    if _LOCALAPPDATA:
+        docker_log = os.path.join(_LOCALAPPDATA, "Docker", "log")
         _add_dir(category, docker_log, "Docker Desktop logs", RiskLevel.SAFE)
 
-    if appdata:
-        docker_desktop = os.path.join(appdata, "Docker Desktop")
+    if _APPDATA:
+        docker_desktop = os.path.join(_APPDATA, "Docker Desktop")
         if os.path.isdir(docker_desktop):
             # Only scan specific safe subdirs
             for subdir, label in [
@@ -73,37 +75,8 @@ def scan() -> CleanupCategory:
                 _add_dir(category, path, label, RiskLevel.SAFE)
 
     # ── Docker buildx cache ──────────────────────────────────────────────
-    if userprofile:
-        buildx = os.path.join(userprofile, ".docker", "buildx")
+    if _USERPROFILE:
+        buildx = os.path.join(_USERPROFILE, ".docker", "buildx")
         _add_dir(category, buildx, "Docker buildx cache", RiskLevel.SAFE)
 
     return category
-
-
-def _add_dir(category: CleanupCategory, dir_path: str, label: str, risk: RiskLevel) -> None:
-    if not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
-        category.items.append(CleanupItem(
-            path=dir_path,
-            size=size,
-            category=category.name,
-            risk=risk,
-            item_type=ItemType.DIRECTORY,
-            description=label,
-        ))
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
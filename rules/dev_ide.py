@@ -7,6 +7,11 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    add_dir_item as _add_dir,
+    APPDATA as _APPDATA,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "dev_ide"
 display_name = "IDE & Editor Caches"
@@ -21,13 +26,9 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    appdata = os.environ.get("APPDATA", "")
-    localappdata = os.environ.get("LOCALAPPDATA", "")
-    userprofile = os.environ.get("USERPROFILE", "")
-
     # ── VS Code ──────────────────────────────────────────────────────────
-    if appdata:
-        vscode_base = os.path.join(appdata, "Code")
+    if _APPDATA:
+        vscode_base = os.path.join(_APPDATA, "Code")
         for subdir, label in [
             ("CachedExtensionVSIXs", "VS Code cached extension VSIXs"),
             ("Cache", "VS Code cache"),
@@ -41,8 +42,8 @@ def scan() -> CleanupCategory:
             _add_dir(category, path, label, RiskLevel.SAFE)
 
     # ── VS Code Insiders ─────────────────────────────────────────────────
-    if appdata:
-        vscode_insiders = os.path.join(appdata, "Code - Insiders")
+    if _APPDATA:
+        vscode_insiders = os.path.join(_APPDATA, "Code - Insiders")
         for subdir, label in [
             ("Cache", "VS Code Insiders cache"),
             ("CachedData", "VS Code Insiders cached data"),
@@ -53,8 +54,8 @@ def scan() -> CleanupCategory:
             _add_dir(category, path, label, RiskLevel.SAFE)
 
     # ── Windsurf (Codeium IDE) ───────────────────────────────────────────
-    if appdata:
-        windsurf_base = os.path.join(appdata, "Windsurf")
+    if _APPDATA:
+        windsurf_base = os.path.join(_APPDATA, "Windsurf")
         for subdir, label in [
             ("Cache", "Windsurf cache"),
             ("CachedData", "Windsurf cached data"),
@@ -66,8 +67,8 @@ def scan() -> CleanupCategory:
             _add_dir(category, path, label, RiskLevel.SAFE)
 
     # ── JetBrains IDEs (IntelliJ, PyCharm, WebStorm, Rider, etc.) ───────
-    if localappdata:
-        jetbrains_base = os.path.join(localappdata, "JetBrains")
+    if _LOCALAPPDATA:
+        jetbrains_base = os.path.join(_LOCALAPPDATA, "JetBrains")
         if os.path.isdir(jetbrains_base):
             try:
                 for entry in os.scandir(jetbrains_base):
@@ -87,17 +88,17 @@ def scan() -> CleanupCategory:
                 pass
 
     # ── Sublime Text cache ───────────────────────────────────────────────
-    if appdata:
-        sublime_cache = os.path.join(appdata, "Sublime Text", "Cache")
+    if _APPDATA:
+        sublime_cache = os.path.join(_APPDATA, "Sublime Text", "Cache")
         _add_dir(category, sublime_cache, "Sublime Text cache", RiskLevel.SAFE)
 
     # ── Unity editor ─────────────────────────────────────────────────────
-    if localappdata:
-        unity_cache = os.path.join(localappdata, "Unity", "cache")
+    if _LOCALAPPDATA:
+        unity_cache = os.path.join(_LOCALAPPDATA, "Unity", "cache")
         _add_dir(category, unity_cache, "Unity editor cache", RiskLevel.SAFE)
 
-    if appdata:
-        unity_logs = os.path.join(appdata, "Unity", "Editor")
+    if _APPDATA:
+        unity_logs = os.path.join(_APPDATA, "Unity", "Editor")
         if os.path.isdir(unity_logs):
             # Only target log files
             try:
@@ -106,7 +107,7 @@ def scan() -> CleanupCategory:
                         try:
                             category.items.append(CleanupItem(
                                 path=entry.path,
-                                size=entry.stat().st_size,
+                                size=entry.stat(follow_symlinks=False).st_size,
                                 category=category.name,
                                 risk=RiskLevel.SAFE,
                                 item_type=ItemType.FILE,
@@ -118,39 +119,10 @@ def scan() -> CleanupCategory:
                 pass
 
     # ── Electron / Chromium-based app caches ─────────────────────────────
-    if appdata:
+    if _APPDATA:
         for app_name in ["Postman", "Slack", "Discord", "Figma"]:
             for subdir in ["Cache", "Code Cache", "GPUCache"]:
-                path = os.path.join(appdata, app_name, subdir)
+                path = os.path.join(_APPDATA, app_name, subdir)
                 _add_dir(category, path, f"{app_name} {subdir}", RiskLevel.SAFE)
 
     return category
-
-
-def _add_dir(category: CleanupCategory, dir_path: str, label: str, risk: RiskLevel) -> None:
-    if not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
-        category.items.append(CleanupItem(
-            path=dir_path,
-            size=size,
-            category=category.name,
-            risk=risk,
-            item_type=ItemType.DIRECTORY,
-            description=label,
-        ))
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
@@ -7,12 +7,21 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    dir_size as _dir_size,
+    add_dir_item as _add_dir,
+    USERPROFILE as _USERPROFILE,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "dev_java"
 display_name = "Java / Android Developer Caches"
 description = "Gradle caches, Maven .m2 repository, Android SDK temp"
 risk = RiskLevel.SAFE
 
+_ANDROID_HOME = (os.environ.get("ANDROID_HOME", "")
+                 or os.path.join(_LOCALAPPDATA, "Android", "Sdk"))
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -21,90 +30,53 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    userprofile = os.environ.get("USERPROFILE", "")
-    localappdata = os.environ.get("LOCALAPPDATA", "")
-
-    if not userprofile:
+    if not _USERPROFILE:
         return category
 
     # ── Gradle caches ────────────────────────────────────────────────────
-    gradle_caches = os.path.join(userprofile, ".gradle", "caches")
+    gradle_caches = os.path.join(_USERPROFILE, ".gradle", "caches")
     _add_dir(category, gradle_caches, "Gradle build caches (re-downloads on build)",
              RiskLevel.SAFE)
 
-    gradle_wrapper = os.path.join(userprofile, ".gradle", "wrapper", "dists")
+    gradle_wrapper = os.path.join(_USERPROFILE, ".gradle", "wrapper", "dists")
     _add_dir(category, gradle_wrapper, "Gradle wrapper distributions", RiskLevel.SAFE)
 
-    gradle_daemon = os.path.join(userprofile, ".gradle", "daemon")
+    gradle_daemon = os.path.join(_USERPROFILE, ".gradle", "daemon")
     _add_dir(category, gradle_daemon, "Gradle daemon logs", RiskLevel.SAFE)
 
     # ── Maven local repository ───────────────────────────────────────────
-    m2_repo = os.path.join(userprofile, ".m2", "repository")
+    m2_repo = os.path.join(_USERPROFILE, ".m2", "repository")
     _add_dir(category, m2_repo, "Maven local repository (re-downloads on build)",
              RiskLevel.LOW)
 
     # ── Android SDK caches ───────────────────────────────────────────────
-    android_home = os.environ.get("ANDROID_HOME", "")
-    if not android_home:
-        android_home = os.path.join(localappdata, "Android", "Sdk")
-
-    if os.path.isdir(android_home):
+    if os.path.isdir(_ANDROID_HOME):
         # Android build cache
-        android_cache = os.path.join(android_home, ".downloadIntermediates")
+        android_cache = os.path.join(_ANDROID_HOME, ".downloadIntermediates")
         _add_dir(category, android_cache, "Android SDK download intermediates", RiskLevel.SAFE)
 
-        android_tmp = os.path.join(android_home, ".temp")
+        android_tmp = os.path.join(_ANDROID_HOME, ".temp")
         _add_dir(category, android_tmp, "Android SDK temp files", RiskLevel.SAFE)
 
     # ── Android user-level caches ────────────────────────────────────────
-    android_dot = os.path.join(userprofile, ".android", "cache")
+    android_dot = os.path.join(_USERPROFILE, ".android", "cache")
     _add_dir(category, android_dot, "Android user cache", RiskLevel.SAFE)
 
-    android_avd_cache = os.path.join(userprofile, ".android", "avd")
+    android_avd_cache = os.path.join(_USERPROFILE, ".android", "avd")
     # Only add if > 100 MB (AVDs are large and intentional)
-    if os.path.isdir(android_avd_cache):
-        size = _dir_size(android_avd_cache)
-        if size > 100_000_000:
-            category.items.append(CleanupItem(
-                path=android_avd_cache,
-                size=size,
-                category=category.name,
-                risk=RiskLevel.MEDIUM,
-                item_type=ItemType.DIRECTORY,
-                description="Android Virtual Devices (AVDs) — delete only if unused",
-            ))
-
-    # ── Kotlin daemon ────────────────────────────────────────────────────
-    kotlin_daemon = os.path.join(localappdata, "kotlin", "daemon")
-    _add_dir(category, kotlin_daemon, "Kotlin daemon data", RiskLevel.SAFE)
-
-    return category
-
-
-def _add_dir(category: CleanupCategory, dir_path: str, label: str, risk: RiskLevel) -> None:
-    if not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
+    size = _dir_size(android_avd_cache)
+    if size > 100_000_000:
         category.items.append(CleanupItem(
-            path=dir_path,
+            path=android_avd_cache,
             size=size,
             category=category.name,
-            risk=risk,
+            risk=RiskLevel.MEDIUM,
             item_type=ItemType.DIRECTORY,
-            description=label,
+            description="Android Virtual Devices (AVDs) — delete only if unused",
         ))
 
+    # ── Kotlin daemon ────────────────────────────────────────────────────
+    kotlin_daemon = os.path.join(_LOCALAPPDATA, "kotlin", "daemon")
+    _add_dir(category, kotlin_daemon, "Kotlin daemon data", RiskLevel.SAFE)
 
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    return category
@@ -7,17 +7,33 @@ from __future__ import annotations
 
 import os
 import time
-from pathlib import Path
+from typing import List, Tuple
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    dir_size as _dir_size,
+    add_dir_item as _add_dir,
+    find_project_roots as _find_project_roots,
+    walk_project_tree as _walk_project_tree,
+    USERPROFILE as _USERPROFILE,
+    APPDATA as _APPDATA,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "dev_nodejs"
 display_name = "Node.js / Frontend Caches"
 description = "npm cache, Yarn cache, pnpm store, and stale node_modules"
 risk = RiskLevel.SAFE
 
+_SKIP_DIRS = frozenset({"node_modules", "dist", "build", "__pycache__", "venv"})
+
 # node_modules older than this many days are considered stale
 STALE_NODE_MODULES_DAYS = 30
 
+# Top-level folders under %USERPROFILE% searched for project trees
+PROJECT_ROOT_CANDIDATES = ["Projects", "Repos", "Source", "Code", "dev", "workspace",
+                           "Documents", "Desktop"]
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -26,119 +42,81 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    appdata = os.environ.get("APPDATA", "")
-    localappdata = os.environ.get("LOCALAPPDATA", "")
-    userprofile = os.environ.get("USERPROFILE", "")
-
     # ── npm cache (%APPDATA%\npm-cache) ──────────────────────────────────
-    if appdata:
-        npm_cache = os.path.join(appdata, "npm-cache")
+    if _APPDATA:
+        npm_cache = os.path.join(_APPDATA, "npm-cache")
         _add_dir(category, npm_cache, "npm global cache", RiskLevel.SAFE)
 
-    # ── Yarn v1 cache (%LOCALAPPDATA%\Yarn\Cache) ───────────────────────
-    if localappdata:
-        yarn_cache = os.path.join(localappdata, "Yarn", "Cache")
+    # ── Yarn v1 / Berry caches (%LOCALAPPDATA%\Yarn\...) ────────────────
+    # Both live under the same (case-insensitive) Yarn folder, so probe it once
+    yarn_root = os.path.join(_LOCALAPPDATA, "Yarn") if _LOCALAPPDATA else ""
+    if yarn_root and os.path.isdir(yarn_root):
+        yarn_cache = os.path.join(yarn_root, "Cache")
         _add_dir(category, yarn_cache, "Yarn v1 cache", RiskLevel.SAFE)
 
-    # ── Yarn Berry cache (%LOCALAPPDATA%\yarn\berry\cache) ──────────────
-    if localappdata:
-        yarn_berry = os.path.join(localappdata, "yarn", "berry", "cache")
+        yarn_berry = os.path.join(yarn_root, "berry", "cache")
         _add_dir(category, yarn_berry, "Yarn Berry cache", RiskLevel.SAFE)
 
-    # ── pnpm store (%LOCALAPPDATA%\pnpm-store) ──────────────────────────
-    if localappdata:
-        pnpm_store = os.path.join(localappdata, "pnpm-store")
-        _add_dir(category, pnpm_store, "pnpm content-addressable store", RiskLevel.SAFE)
-
-    # ── pnpm cache (%LOCALAPPDATA%\pnpm\store) ──────────────────────────
-    if localappdata:
-        pnpm_cache = os.path.join(localappdata, "pnpm", "store")
-        _add_dir(category, pnpm_cache, "pnpm store", RiskLevel.SAFE)
+    # ── pnpm store (%LOCALAPPDATA%\pnpm-store or %LOCALAPPDATA%\pnpm\store) ─
+    # Only one normally exists, but one may be a junction to the other, so
+    # resolve real paths and size each physical store once.
+    if _LOCALAPPDATA:
+        pnpm_paths = [
+            (os.path.join(_LOCALAPPDATA, "pnpm-store"), "pnpm content-addressable store"),
+            (os.path.join(_LOCALAPPDATA, "pnpm", "store"), "pnpm store"),
+        ]
+        seen = set()
+        for pnpm_path, label in pnpm_paths:
+            real_path = os.path.normcase(os.path.realpath(pnpm_path))
+            if real_path in seen:
+                continue
+            seen.add(real_path)
+            _add_dir(category, pnpm_path, label, RiskLevel.SAFE)
 
     # ── Bun cache (%USERPROFILE%\.bun\install\cache) ────────────────────
-    if userprofile:
-        bun_cache = os.path.join(userprofile, ".bun", "install", "cache")
+    if _USERPROFILE:
+        bun_cache = os.path.join(_USERPROFILE, ".bun", "install", "cache")
         _add_dir(category, bun_cache, "Bun install cache", RiskLevel.SAFE)
 
     # ── Stale node_modules in common project dirs ────────────────────────
-    if userprofile:
-        _scan_stale_node_modules(category, userprofile)
+    if _USERPROFILE:
+        _scan_stale_node_modules(category, _USERPROFILE)
 
     return category
 
 
 def _scan_stale_node_modules(category: CleanupCategory, userprofile: str) -> None:
     """Find node_modules directories that haven't been modified recently."""
-    search_roots = []
-    for candidate in ["Projects", "Repos", "Source", "Code", "dev", "workspace",
-                       "Documents", "Desktop"]:
-        path = os.path.join(userprofile, candidate)
-        if os.path.isdir(path):
-            search_roots.append(path)
+    search_roots = _find_project_roots(userprofile, PROJECT_ROOT_CANDIDATES)
 
     cutoff = time.time() - (STALE_NODE_MODULES_DAYS * 86400)
 
-    for root in search_roots:
-        try:
-            for dirpath, dirnames, _filenames in os.walk(root):
-                # Don't recurse into node_modules itself
-                if "node_modules" in dirnames:
-                    nm_path = os.path.join(dirpath, "node_modules")
-                    try:
-                        mtime = os.path.getmtime(nm_path)
-                        if mtime < cutoff:
-                            size = _dir_size(nm_path)
-                            if size > 1_000_000:  # Only flag if > 1 MB
-                                category.items.append(CleanupItem(
-                                    path=nm_path,
-                                    size=size,
-                                    category=category.name,
-                                    risk=RiskLevel.LOW,
-                                    item_type=ItemType.DIRECTORY,
-                                    description=f"Stale node_modules (>{STALE_NODE_MODULES_DAYS}d old)",
-                                ))
-                    except (OSError, PermissionError):
-                        pass
-                    dirnames.remove("node_modules")
-
-                # Limit depth — don't go too deep
-                depth = dirpath.replace(root, "").count(os.sep)
-                if depth >= 4:
-                    dirnames.clear()
-
-                # Skip hidden dirs and common non-project dirs
-                dirnames[:] = [d for d in dirnames
-                               if not d.startswith(".")
-                               and d not in {"node_modules", ".git", "dist", "build",
-                                             "__pycache__", "venv", ".venv"}]
-        except (OSError, PermissionError):
-            pass
-
-
-def _add_dir(category: CleanupCategory, dir_path: str, label: str, risk: RiskLevel) -> None:
-    if not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
-        category.items.append(CleanupItem(
-            path=dir_path,
-            size=size,
-            category=category.name,
-            risk=risk,
-            item_type=ItemType.DIRECTORY,
-            description=label,
-        ))
-
+    rows: List[Tuple[str, int]] = []
+    append = rows.append
 
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
+    for root in search_roots:
+        for dirpath, dirnames, _filenames in _walk_project_tree(root, 4, _SKIP_DIRS):
+            # Don't recurse into node_modules itself
+            if "node_modules" in dirnames:
+                nm_path = dirpath + os.sep + "node_modules"
                 try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
+                    mtime = os.path.getmtime(nm_path)
+                    if mtime < cutoff:
+                        size = _dir_size(nm_path)
+                        if size > 1_000_000:  # Only flag if > 1 MB
+                            append((nm_path, size))
                 except (OSError, PermissionError):
                     pass
-    except (OSError, PermissionError):
-        pass
-    return total
+                dirnames.remove("node_modules")
+
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=RiskLevel.LOW,
+            item_type=ItemType.DIRECTORY,
+            description=f"Stale node_modules (>{STALE_NODE_MODULES_DAYS}d old)",
+        )
+        for path, size in rows
+    )
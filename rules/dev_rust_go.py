@@ -7,15 +7,36 @@ from __future__ import annotations
 
 import os
 import time
+from typing import List, Tuple
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    dir_size as _dir_size,
+    add_dir_item as _add_dir,
+    find_project_roots as _find_project_roots,
+    walk_project_tree as _walk_project_tree,
+    USERPROFILE as _USERPROFILE,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "dev_rust_go"
 display_name = "Rust & Go Developer Caches"
 description = "Cargo registry cache, Go module cache"
 risk = RiskLevel.SAFE
 
+_SKIP_DIRS = frozenset({"node_modules", "target", "vendor", "__pycache__"})
+
 STALE_TARGET_DAYS = 30
 
+# Top-level folders under %USERPROFILE% searched for Cargo projects
+PROJECT_ROOT_CANDIDATES = ["Projects", "Repos", "Source", "Code", "dev", "workspace"]
+
+_CARGO_HOME = os.environ.get("CARGO_HOME", os.path.join(_USERPROFILE, ".cargo"))
+_GO_MOD_CACHE = os.path.join(
+    os.environ.get("GOPATH", os.path.join(_USERPROFILE, "go")), "pkg", "mod", "cache")
+_GO_BUILD_CACHE = os.environ.get("GOCACHE", "") or (
+    os.path.join(_LOCALAPPDATA, "go-build") if _LOCALAPPDATA else "")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -24,114 +45,68 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    userprofile = os.environ.get("USERPROFILE", "")
-    if not userprofile:
+    if not _USERPROFILE:
         return category
 
     # ── Rust / Cargo ─────────────────────────────────────────────────────
-    cargo_home = os.environ.get("CARGO_HOME", os.path.join(userprofile, ".cargo"))
-
-    cargo_registry_cache = os.path.join(cargo_home, "registry", "cache")
-    _add_dir(category, cargo_registry_cache, "Cargo registry cache (compressed crates)",
-             RiskLevel.SAFE)
+    # Skip the four cache probes entirely when Rust isn't installed
+    if os.path.isdir(_CARGO_HOME):
+        cargo_registry_cache = os.path.join(_CARGO_HOME, "registry", "cache")
+        _add_dir(category, cargo_registry_cache, "Cargo registry cache (compressed crates)",
+                 RiskLevel.SAFE)
 
-    cargo_registry_src = os.path.join(cargo_home, "registry", "src")
-    _add_dir(category, cargo_registry_src, "Cargo registry source (extracted crates)",
-             RiskLevel.SAFE)
+        cargo_registry_src = os.path.join(_CARGO_HOME, "registry", "src")
+        _add_dir(category, cargo_registry_src, "Cargo registry source (extracted crates)",
+                 RiskLevel.SAFE)
 
-    cargo_git_db = os.path.join(cargo_home, "git", "db")
-    _add_dir(category, cargo_git_db, "Cargo git dependency cache", RiskLevel.SAFE)
+        cargo_git_db = os.path.join(_CARGO_HOME, "git", "db")
+        _add_dir(category, cargo_git_db, "Cargo git dependency cache", RiskLevel.SAFE)
 
-    cargo_git_co = os.path.join(cargo_home, "git", "checkouts")
-    _add_dir(category, cargo_git_co, "Cargo git checkouts", RiskLevel.SAFE)
+        cargo_git_co = os.path.join(_CARGO_HOME, "git", "checkouts")
+        _add_dir(category, cargo_git_co, "Cargo git checkouts", RiskLevel.SAFE)
 
     # ── Stale Rust target/ directories ───────────────────────────────────
-    _scan_stale_target_dirs(category, userprofile)
+    _scan_stale_target_dirs(category, _USERPROFILE)
 
     # ── Go module cache ──────────────────────────────────────────────────
-    gopath = os.environ.get("GOPATH", os.path.join(userprofile, "go"))
-    go_mod_cache = os.path.join(gopath, "pkg", "mod", "cache")
-    _add_dir(category, go_mod_cache, "Go module cache", RiskLevel.SAFE)
-
-    go_build_cache = os.environ.get("GOCACHE", "")
-    if not go_build_cache:
-        localappdata = os.environ.get("LOCALAPPDATA", "")
-        if localappdata:
-            go_build_cache = os.path.join(localappdata, "go-build")
-    _add_dir(category, go_build_cache, "Go build cache", RiskLevel.SAFE)
+    _add_dir(category, _GO_MOD_CACHE, "Go module cache", RiskLevel.SAFE)
+    _add_dir(category, _GO_BUILD_CACHE, "Go build cache", RiskLevel.SAFE)
 
     return category
 
 
 def _scan_stale_target_dirs(category: CleanupCategory, userprofile: str) -> None:
     """Find Rust target/ directories that haven't been modified recently."""
-    search_roots = []
-    for candidate in ["Projects", "Repos", "Source", "Code", "dev", "workspace"]:
-        path = os.path.join(userprofile, candidate)
-        if os.path.isdir(path):
-            search_roots.append(path)
+    search_roots = _find_project_roots(userprofile, PROJECT_ROOT_CANDIDATES)
 
     cutoff = time.time() - (STALE_TARGET_DAYS * 86400)
 
-    for root in search_roots:
-        try:
-            for dirpath, dirnames, filenames in os.walk(root):
-                # Look for Cargo.toml + target/ combo
-                if "Cargo.toml" in filenames and "target" in dirnames:
-                    target_path = os.path.join(dirpath, "target")
-                    try:
-                        mtime = os.path.getmtime(target_path)
-                        if mtime < cutoff:
-                            size = _dir_size(target_path)
-                            if size > 10_000_000:  # Only flag if > 10 MB
-                                category.items.append(CleanupItem(
-                                    path=target_path,
-                                    size=size,
-                                    category=category.name,
-                                    risk=RiskLevel.SAFE,
-                                    item_type=ItemType.DIRECTORY,
-                                    description=f"Stale Rust target/ (>{STALE_TARGET_DAYS}d old)",
-                                ))
-                    except (OSError, PermissionError):
-                        pass
-                    dirnames[:] = [d for d in dirnames if d != "target"]
-
-                depth = dirpath.replace(root, "").count(os.sep)
-                if depth >= 4:
-                    dirnames.clear()
-
-                dirnames[:] = [d for d in dirnames
-                               if not d.startswith(".")
-                               and d not in {"node_modules", ".git", "target",
-                                             "vendor", "__pycache__"}]
-        except (OSError, PermissionError):
-            pass
-
-
-def _add_dir(category: CleanupCategory, dir_path: str, label: str, risk: RiskLevel) -> None:
-    if not dir_path or not os.path.isdir(dir_path):
-        return
-    size = _dir_size(dir_path)
-    if size > 0:
-        category.items.append(CleanupItem(
-            path=dir_path,
-            size=size,
-            category=category.name,
-            risk=risk,
-            item_type=ItemType.DIRECTORY,
-            description=label,
-        ))
-
+    rows: List[Tuple[str, int]] = []
+    append = rows.append
 
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
+    for root in search_roots:
+        for dirpath, dirnames, filenames in _walk_project_tree(root, 4, _SKIP_DIRS):
+            # Look for Cargo.toml + target/ combo
+            if "Cargo.toml" in filenames and "target" in dirnames:
+                target_path = dirpath + os.sep + "target"
                 try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
+                    mtime = os.path.getmtime(target_path)
+                    if mtime < cutoff:
+                        size = _dir_size(target_path)
+                        if size > 10_000_000:  # Only flag if > 10 MB
+                            append((target_path, size))
                 except (OSError, PermissionError):
                     pass
-    except (OSError, PermissionError):
-        pass
-    return total
+                dirnames.remove("target")
+
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=RiskLevel.SAFE,
+            item_type=ItemType.DIRECTORY,
+            description=f"Stale Rust target/ (>{STALE_TARGET_DAYS}d old)",
+        )
+        for path, size in rows
+    )
@@ -12,16 +12,26 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import threading
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size, WINDIR as _WINDIR
 
 name = "driver_store_cleanup"
 display_name = "Old Driver Packages"
 description = "Superseded driver versions in DriverStore\\FileRepository"
 risk = RiskLevel.MEDIUM
 
+# pnputil is killed if enumeration takes longer than this
+ENUM_TIMEOUT_S = 30
+
+_DIGITS_RE = re.compile(r"\d+")
+_DATE_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+
+_REPO_DIR = os.path.join(_WINDIR, "System32", "DriverStore", "FileRepository")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -41,15 +51,12 @@ def scan() -> CleanupCategory:
         if key:
             groups[key].append(drv)
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    repo_dir = os.path.join(windir, "System32", "DriverStore", "FileRepository")
-
     for orig_name, drv_list in groups.items():
         if len(drv_list) < 2:
             continue  # Only one version, nothing to clean
 
         # Sort by version descending, then date descending — keep the first (newest)
-        drv_list.sort(key=lambda d: (d.get("version", ""), d.get("date", "")), reverse=True)
+        drv_list.sort(key=_driver_sort_key, reverse=True)
 
         # All except the newest are candidates for removal
         for drv in drv_list[1:]:
@@ -59,7 +66,7 @@ def scan() -> CleanupCategory:
 
             # Estimate size from the FileRepository folder
             # Driver folders are named like: <inf_name_without_ext>.inf_<arch>_<hash>
-            folder_size = _estimate_driver_folder_size(repo_dir, published_name)
+            folder_size = _estimate_driver_folder_size(_REPO_DIR, published_name)
 
             provider = drv.get("provider", "Unknown")
             class_name = drv.get("class_name", "Unknown")
@@ -80,31 +87,62 @@ def scan() -> CleanupCategory:
     return category
 
 
+def _driver_sort_key(drv: dict) -> Tuple[Tuple[int, ...], Tuple[int, ...]]:
+    """
+    Build a numeric (version, date) sort key for a driver record.
+
+    Versions compare component-wise as integers so "10.0.1" sorts above
+    "9.5.0"; the date only breaks ties. Dates are "mm/dd/yyyy" and are
+    reordered to (yyyy, mm, dd).
+    """
+    version = tuple(int(p) for p in _DIGITS_RE.findall(drv.get("version", "")))
+    date_parts = [int(p) for p in _DIGITS_RE.findall(drv.get("date", ""))]
+    date = tuple(date_parts[2:3] + date_parts[:2]) if len(date_parts) == 3 else tuple(date_parts)
+    return version, date
+
+
 def _enumerate_drivers() -> List[dict]:
     """
     Run pnputil /enum-drivers and parse the output into a list of dicts.
 
+    Output is parsed line by line as pnputil writes it, so only one driver
+    record is buffered at a time. A timer kills pnputil if it runs longer
+    than ENUM_TIMEOUT_S.
+
     Each dict has keys: published_name, original_name, provider,
     class_name, version, date, signer.
     """
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["pnputil", "/enum-drivers"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            timeout=30,
+            bufsize=1,
         )
-        if result.returncode != 0:
-            return []
+    except (OSError, PermissionError):
+        return []
 
-        return _parse_pnputil_output(result.stdout)
+    timer = threading.Timer(ENUM_TIMEOUT_S, proc.kill)
+    timer.start()
+    try:
+        with proc.stdout:
+            drivers = _parse_pnputil_output(proc.stdout)
+        returncode = proc.wait()
+    except (OSError, PermissionError):
+        proc.kill()
+        return []
+    finally:
+        timer.cancel()
 
-    except (subprocess.TimeoutExpired, OSError, PermissionError):
+    if returncode != 0:
         return []
 
+    return drivers
+
 
-def _parse_pnputil_output(output: str) -> List[dict]:
-    """Parse pnputil /enum-drivers output into structured records."""
+def _parse_pnputil_output(lines: Iterable[str]) -> List[dict]:
+    """Parse pnputil /enum-drivers output lines into structured records."""
     drivers: List[dict] = []
     current: dict = {}
 
@@ -115,11 +153,10 @@ def _parse_pnputil_output(output: str) -> List[dict]:
         "provider name": "provider",
         "class name": "class_name",
         "class guid": "class_guid",
-        "driver version": "version",
         "signer name": "signer",
     }
 
-    for line in output.splitlines():
+    for line in lines:
         line = line.strip()
         if not line:
             if current:
@@ -133,14 +170,15 @@ def _parse_pnputil_output(output: str) -> List[dict]:
             label = match.group(1).strip().lower()
             value = match.group(2).strip()
 
-            # "Driver Version and Date" is special: "mm/dd/yyyy version"
-            if label == "driver version and date":
+            # Current pnputil prints "Driver Version: mm/dd/yyyy a.b.c.d";
+            # older builds label it "Driver Version and Date"
+            if label in ("driver version", "driver version and date"):
                 parts = value.split()
-                if len(parts) >= 2:
+                if len(parts) >= 2 and _DATE_RE.fullmatch(parts[0]):
                     current["date"] = parts[0]
                     current["version"] = parts[1]
                 elif parts:
-                    current["version"] = parts[0]
+                    current["version"] = parts[-1]
             else:
                 key = field_map.get(label)
                 if key:
@@ -178,17 +216,3 @@ def _estimate_driver_folder_size(repo_dir: str, published_name: str) -> int:
         pass
 
     return total
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
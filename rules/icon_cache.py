@@ -8,12 +8,16 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import LOCALAPPDATA as _LOCALAPPDATA
 
 name = "icon_cache"
 display_name = "Windows Icon Cache"
 description = "Icon cache files (IconCache.db) — regenerated on reboot"
 risk = RiskLevel.LOW
 
+_ICON_CACHE_DB = os.path.join(_LOCALAPPDATA, "IconCache.db")
+_EXPLORER_DIR = os.path.join(_LOCALAPPDATA, "Microsoft", "Windows", "Explorer")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -22,31 +26,28 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    localappdata = os.environ.get("LOCALAPPDATA", "")
-    if not localappdata:
+    if not _LOCALAPPDATA:
         return category
 
     # ── Main IconCache.db ────────────────────────────────────────────────
-    icon_cache = os.path.join(localappdata, "IconCache.db")
-    _add_file(category, icon_cache, "Windows icon cache (main)")
+    _add_file(category, _ICON_CACHE_DB, "Windows icon cache (main)")
 
     # ── Explorer icon cache files ────────────────────────────────────────
-    explorer_dir = os.path.join(localappdata, "Microsoft", "Windows", "Explorer")
-    if os.path.isdir(explorer_dir):
+    if os.path.isdir(_EXPLORER_DIR):
         try:
-            for entry in os.scandir(explorer_dir):
+            for entry in os.scandir(_EXPLORER_DIR):
                 try:
-                    if entry.is_file(follow_symlinks=False):
-                        name_lower = entry.name.lower()
-                        if "iconcache" in name_lower:
-                            category.items.append(CleanupItem(
-                                path=entry.path,
-                                size=entry.stat().st_size,
-                                category=category.name,
-                                risk=risk,
-                                item_type=ItemType.FILE,
-                                description="Explorer icon cache",
-                            ))
+                    # Explorer names these iconcache_16.db, iconcache_idx.db, ...
+                    if (entry.name.lower().startswith("iconcache")
+                            and entry.is_file(follow_symlinks=False)):
+                        category.items.append(CleanupItem(
+                            path=entry.path,
+                            size=entry.stat(follow_symlinks=False).st_size,
+                            category=category.name,
+                            risk=risk,
+                            item_type=ItemType.FILE,
+                            description="Explorer icon cache",
+                        ))
                 except (OSError, PermissionError):
                     pass
         except (OSError, PermissionError):
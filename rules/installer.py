@@ -6,13 +6,22 @@ Scans C:\\Windows\\Installer\\$PatchCache$ and orphaned .tmp files.
 from __future__ import annotations
 
 import os
+from typing import List, Tuple
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size, WINDIR as _WINDIR
 
 name = "installer"
 display_name = "Installer Patch Cache"
 description = "Windows Installer patch cache and orphaned temp files"
 risk = RiskLevel.MEDIUM
 
+# Suffixes of leftover installer temp files (matched lowercase)
+TEMP_SUFFIXES = (".tmp", ".temp")
+
+_INSTALLER_DIR = os.path.join(_WINDIR, "Installer")
+_PATCH_CACHE = os.path.join(_INSTALLER_DIR, "$PatchCache$")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -21,54 +30,44 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-
     # $PatchCache$ — contains cached patches for installed MSI applications
-    patch_cache = os.path.join(windir, "Installer", "$PatchCache$")
-    if os.path.isdir(patch_cache):
-        size = _dir_size(patch_cache)
-        if size > 0:
-            category.items.append(CleanupItem(
-                path=patch_cache,
-                size=size,
-                category=category.name,
-                risk=risk,
-                item_type=ItemType.DIRECTORY,
-                description="MSI patch cache (may prevent repair of some apps)",
-            ))
+    size = _dir_size(_PATCH_CACHE)
+    if size > 0:
+        category.items.append(CleanupItem(
+            path=_PATCH_CACHE,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.DIRECTORY,
+            description="MSI patch cache (may prevent repair of some apps)",
+        ))
 
     # Orphaned .tmp files in Installer directory
-    installer_dir = os.path.join(windir, "Installer")
-    if os.path.isdir(installer_dir):
+    if os.path.isdir(_INSTALLER_DIR):
+        rows: List[Tuple[str, int]] = []
+        append = rows.append
         try:
-            for entry in os.scandir(installer_dir):
-                try:
-                    if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".tmp"):
-                        category.items.append(CleanupItem(
-                            path=entry.path,
-                            size=entry.stat().st_size,
-                            category=category.name,
-                            risk=risk,
-                            item_type=ItemType.FILE,
-                            description="Orphaned installer temp file",
-                        ))
-                except (OSError, PermissionError):
-                    pass
+            with os.scandir(_INSTALLER_DIR) as it:
+                for entry in it:
+                    if not entry.name.lower().endswith(TEMP_SUFFIXES):
+                        continue
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            append((entry.path, entry.stat(follow_symlinks=False).st_size))
+                    except (OSError, PermissionError):
+                        pass
         except (OSError, PermissionError):
             pass
+        category.items.extend(
+            CleanupItem(
+                path=path,
+                size=size,
+                category=category.name,
+                risk=risk,
+                item_type=ItemType.FILE,
+                description="Orphaned installer temp file",
+            )
+            for path, size in rows
+        )
 
     return category
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
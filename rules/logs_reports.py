@@ -5,13 +5,36 @@ Rule: Logs & Error Reports — Windows logs, WER reports, crash dumps.
 from __future__ import annotations
 
 import os
+import re
+from typing import List, Tuple
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    dir_size as _dir_size,
+    fast_file_size,
+    walk_files,
+    WINDIR as _WINDIR,
+    PROGRAMDATA as _PROGRAMDATA,
+    LOCALAPPDATA as _LOCALAPPDATA,
+)
 
 name = "logs_reports"
 display_name = "Logs & Error Reports"
 description = "Windows log files, error reports (WER), and crash dump files"
 risk = RiskLevel.SAFE
 
+# Suffixes picked up by the recursive log scan (case-insensitive)
+_LOG_RE = re.compile(r"\.(?:log|etl|old|bak)\Z", re.IGNORECASE)
+
+_LOGS_DIR = os.path.join(_WINDIR, "Logs")
+_USER_WER = os.path.join(_LOCALAPPDATA, "Microsoft", "Windows", "WER")
+_SYSTEM_WER = os.path.join(_PROGRAMDATA, "Microsoft", "Windows", "WER")
+_MINIDUMP_DIR = os.path.join(_WINDIR, "Minidump")
+_USER_DUMPS = os.path.join(_LOCALAPPDATA, "CrashDumps")
+_PANTHER_DIR = os.path.join(_WINDIR, "Panther")
+_LKR_DIR = os.path.join(_WINDIR, "LiveKernelReports")
+_MEMORY_DMP = os.path.join(_WINDIR, "MEMORY.DMP")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -20,66 +43,52 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    local_app = os.environ.get("LOCALAPPDATA", "")
-
     # ── Windows Logs directory ───────────────────────────────────────────
-    logs_dir = os.path.join(windir, "Logs")
-    _scan_log_dir(category, logs_dir, "Windows log")
+    _scan_log_dir(category, _LOGS_DIR, "Windows log")
 
     # ── Windows Error Reporting (user) ───────────────────────────────────
-    if local_app:
-        user_wer = os.path.join(local_app, "Microsoft", "Windows", "WER")
-        _scan_dir_recursive(category, user_wer, "User error report")
+    if _LOCALAPPDATA:
+        _scan_dir_recursive(category, _USER_WER, "User error report")
 
     # ── Windows Error Reporting (system) ─────────────────────────────────
-    system_wer = os.path.join(os.environ.get("PROGRAMDATA", r"C:\ProgramData"),
-                              "Microsoft", "Windows", "WER")
-    _scan_dir_recursive(category, system_wer, "System error report")
+    _scan_dir_recursive(category, _SYSTEM_WER, "System error report")
 
     # ── Crash Dumps ──────────────────────────────────────────────────────
-    minidump = os.path.join(windir, "Minidump")
-    _scan_dir_flat(category, minidump, "BSOD minidump")
+    _scan_dir_flat(category, _MINIDUMP_DIR, "BSOD minidump")
 
-    if local_app:
-        user_dumps = os.path.join(local_app, "CrashDumps")
-        _scan_dir_flat(category, user_dumps, "User crash dump")
+    if _LOCALAPPDATA:
+        _scan_dir_flat(category, _USER_DUMPS, "User crash dump")
 
     # ── Windows Panther (setup/upgrade logs) ─────────────────────────
-    panther_dir = os.path.join(windir, "Panther")
-    if os.path.isdir(panther_dir):
-        size = _dir_size(panther_dir)
-        if size > 0:
-            category.items.append(CleanupItem(
-                path=panther_dir,
-                size=size,
-                category=category.name,
-                risk=risk,
-                item_type=ItemType.DIRECTORY,
-                description="Windows setup/upgrade logs (Panther)",
-            ))
+    size = _dir_size(_PANTHER_DIR)
+    if size > 0:
+        category.items.append(CleanupItem(
+            path=_PANTHER_DIR,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.DIRECTORY,
+            description="Windows setup/upgrade logs (Panther)",
+        ))
 
     # ── Live Kernel Reports ────────────────────────────────────────
-    lkr_dir = os.path.join(windir, "LiveKernelReports")
-    if os.path.isdir(lkr_dir):
-        size = _dir_size(lkr_dir)
-        if size > 0:
-            category.items.append(CleanupItem(
-                path=lkr_dir,
-                size=size,
-                category=category.name,
-                risk=risk,
-                item_type=ItemType.DIRECTORY,
-                description="Live kernel dump reports",
-            ))
+    size = _dir_size(_LKR_DIR)
+    if size > 0:
+        category.items.append(CleanupItem(
+            path=_LKR_DIR,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.DIRECTORY,
+            description="Live kernel dump reports",
+        ))
 
     # ── Memory dump ──────────────────────────────────────────────────
-    memory_dmp = os.path.join(windir, "MEMORY.DMP")
-    if os.path.isfile(memory_dmp):
+    if os.path.isfile(_MEMORY_DMP):
         try:
-            size = os.path.getsize(memory_dmp)
+            size = fast_file_size(_MEMORY_DMP)
             category.items.append(CleanupItem(
-                path=memory_dmp,
+                path=_MEMORY_DMP,
                 size=size,
                 category=category.name,
                 risk=risk,
@@ -96,32 +105,30 @@ def _scan_log_dir(category: CleanupCategory, log_dir: str, label: str) -> None:
     """Scan for .log, .etl, .evtx files recursively."""
     if not os.path.isdir(log_dir):
         return
-    log_extensions = {".log", ".etl", ".old", ".bak"}
-    try:
-        for dirpath, _, filenames in os.walk(log_dir):
-            for f in filenames:
-                ext = os.path.splitext(f)[1].lower()
-                if ext in log_extensions:
-                    fp = os.path.join(dirpath, f)
-                    try:
-                        category.items.append(CleanupItem(
-                            path=fp,
-                            size=os.path.getsize(fp),
-                            category=category.name,
-                            risk=risk,
-                            item_type=ItemType.FILE,
-                            description=f"{label} ({ext})",
-                        ))
-                    except (OSError, PermissionError):
-                        pass
-    except (OSError, PermissionError):
-        pass
+    # (path, size, extension) rows, turned into CleanupItems after the walk
+    rows: List[Tuple[str, int, str]] = []
+    append = rows.append
+    search = _LOG_RE.search
+    for entry, size in walk_files(log_dir):
+        m = search(entry.name)
+        if m:
+            append((entry.path, size, m.group().lower()))
+
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.FILE,
+            description=f"{label} ({ext})",
+        )
+        for path, size, ext in rows
+    )
 
 
 def _scan_dir_recursive(category: CleanupCategory, dir_path: str, label: str) -> None:
     """Add entire directory as a single item with computed size."""
-    if not os.path.isdir(dir_path):
-        return
     size = _dir_size(dir_path)
     if size > 0:
         category.items.append(CleanupItem(
@@ -138,33 +145,27 @@ def _scan_dir_flat(category: CleanupCategory, dir_path: str, label: str) -> None
     """Add individual files from a directory."""
     if not os.path.isdir(dir_path):
         return
+    # (path, size) rows, turned into CleanupItems after the listing
+    rows: List[Tuple[str, int]] = []
+    append = rows.append
     try:
         for entry in os.scandir(dir_path):
             try:
                 if entry.is_file(follow_symlinks=False):
-                    category.items.append(CleanupItem(
-                        path=entry.path,
-                        size=entry.stat().st_size,
-                        category=category.name,
-                        risk=risk,
-                        item_type=ItemType.FILE,
-                        description=label,
-                    ))
+                    append((entry.path, entry.stat(follow_symlinks=False).st_size))
             except (OSError, PermissionError):
                 pass
     except (OSError, PermissionError):
         pass
 
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=ItemType.FILE,
+            description=label,
+        )
+        for path, size in rows
+    )
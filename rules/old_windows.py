@@ -7,12 +7,25 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size
 
 name = "old_windows"
 display_name = "Old Windows Installations"
 description = "Previous Windows installations (Windows.old, upgrade temp folders)"
 risk = RiskLevel.SAFE
 
+# Checked on the system drive
+_SYS_DRIVE_ROOT = os.environ.get("SYSTEMDRIVE", "C:") + os.sep
+
+_OLD_DIRS = [
+    (os.path.join(_SYS_DRIVE_ROOT, dirname), label)
+    for dirname, label in (
+        ("Windows.old", "Previous Windows installation"),
+        ("$Windows.~BT", "Windows upgrade temporary files"),
+        ("$Windows.~WS", "Windows upgrade source files"),
+    )
+]
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -21,17 +34,7 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    # Check on the system drive
-    sys_drive = os.environ.get("SYSTEMDRIVE", "C:")
-
-    old_dirs = [
-        ("Windows.old", "Previous Windows installation"),
-        ("$Windows.~BT", "Windows upgrade temporary files"),
-        ("$Windows.~WS", "Windows upgrade source files"),
-    ]
-
-    for dirname, label in old_dirs:
-        dir_path = os.path.join(sys_drive + os.sep, dirname)
+    for dir_path, label in _OLD_DIRS:
         if os.path.isdir(dir_path):
             size = _dir_size(dir_path)
             category.items.append(CleanupItem(
@@ -44,17 +47,3 @@ def scan() -> CleanupCategory:
             ))
 
     return category
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
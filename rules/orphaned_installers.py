@@ -12,16 +12,24 @@ referenced are considered orphaned.
 from __future__ import annotations
 
 import os
+import sys
 import winreg
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Iterator, Set
 
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import WINDIR as _WINDIR
 
 name = "orphaned_installers"
 display_name = "Orphaned Installer Packages"
 description = "Unreferenced .msi/.msp files in C:\\Windows\\Installer"
 risk = RiskLevel.MEDIUM
 
+_INSTALLER_DIR = os.path.join(_WINDIR, "Installer")
+
+# Read the native 64-bit view directly instead of relying on WOW64 redirection
+_REG_ACCESS = winreg.KEY_READ | winreg.KEY_WOW64_64KEY
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -30,10 +38,7 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    installer_dir = os.path.join(windir, "Installer")
-
-    if not os.path.isdir(installer_dir):
+    if not os.path.isdir(_INSTALLER_DIR):
         return category
 
     # Step 1: Collect all .msi/.msp filenames currently referenced in the registry
@@ -41,24 +46,22 @@ def scan() -> CleanupCategory:
 
     # Step 2: Scan the Installer directory for .msi and .msp files
     try:
-        for entry in os.scandir(installer_dir):
+        for entry in os.scandir(_INSTALLER_DIR):
             try:
-                if not entry.is_file(follow_symlinks=False):
-                    continue
-                lower = entry.name.lower()
-                if not (lower.endswith(".msi") or lower.endswith(".msp")):
+                lower = sys.intern(entry.name.lower())
+                is_msi = lower.endswith(".msi")
+                if not (is_msi or lower.endswith(".msp")):
                     continue
 
                 # Check if this file is referenced
-                if entry.name.lower() in referenced:
+                if lower in referenced or not entry.is_file(follow_symlinks=False):
                     continue
 
-                size = entry.stat().st_size
-                if size == 0:
+                size = entry.stat(follow_symlinks=False).st_size
+                if not size:
                     continue
 
-                ext = os.path.splitext(entry.name)[1].lower()
-                label = "Orphaned MSI package" if ext == ".msi" else "Orphaned MSP patch"
+                label = "Orphaned MSI package" if is_msi else "Orphaned MSP patch"
 
                 category.items.append(CleanupItem(
                     path=entry.path,
@@ -76,11 +79,15 @@ def scan() -> CleanupCategory:
     return category
 
 
-def _get_referenced_packages() -> Set[str]:
+@lru_cache(maxsize=1)
+def _get_referenced_packages() -> FrozenSet[str]:
     """
     Query the registry to find all .msi/.msp filenames currently referenced
     by installed products.
 
+    The result is cached for the lifetime of the process; call
+    _get_referenced_packages.cache_clear() to force a fresh lookup.
+
     Checks:
       HKLM\\SOFTWARE\\Microsoft\\Windows\\CurrentVersion\\Installer\\UserData\\<SID>\\Products\\<ProductCode>\\InstallProperties
         -> LocalPackage value
@@ -92,14 +99,8 @@ def _get_referenced_packages() -> Set[str]:
     base_key = r"SOFTWARE\Microsoft\Windows\CurrentVersion\Installer\UserData"
 
     try:
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_key) as ud_key:
-            sid_count = winreg.QueryInfoKey(ud_key)[0]
-            for i in range(sid_count):
-                try:
-                    sid = winreg.EnumKey(ud_key, i)
-                except OSError:
-                    continue
-
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, base_key, 0, _REG_ACCESS) as ud_key:
+            for sid in _iter_subkeys(ud_key):
                 # Products
                 _collect_local_packages(
                     referenced,
@@ -117,7 +118,7 @@ def _get_referenced_packages() -> Set[str]:
     except OSError:
         pass
 
-    return referenced
+    return frozenset(referenced)
 
 
 def _collect_local_packages(
@@ -127,17 +128,30 @@ def _collect_local_packages(
 ) -> None:
     """Walk product/patch subkeys and extract LocalPackage filenames."""
     try:
-        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, sub_path) as parent:
-            count = winreg.QueryInfoKey(parent)[0]
-            for i in range(count):
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, sub_path, 0, _REG_ACCESS) as parent:
+            for code in _iter_subkeys(parent):
                 try:
-                    code = winreg.EnumKey(parent, i)
-                    props_path = f"{sub_path}\\{code}\\{props_subkey}"
-                    with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, props_path) as pk:
+                    # Open relative to the parent handle rather than from HKLM
+                    with winreg.OpenKey(parent, f"{code}\\{props_subkey}",
+                                        0, _REG_ACCESS) as pk:
                         val, _ = winreg.QueryValueEx(pk, "LocalPackage")
                         if val:
-                            referenced.add(os.path.basename(val).lower())
+                            base = os.path.basename(val).lower()
+                            # Only package files can match the Installer scan
+                            if base.endswith((".msi", ".msp")):
+                                referenced.add(sys.intern(base))
                 except OSError:
                     continue
     except OSError:
         pass
+
+
+def _iter_subkeys(key) -> Iterator[str]:
+    """Yield subkey names of an open registry key until EnumKey runs out."""
+    i = 0
+    while True:
+        try:
+            yield winreg.EnumKey(key, i)
+        except OSError:
+            return
+        i += 1
@@ -9,12 +9,15 @@ from __future__ import annotations
 import os
 import glob
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import WINDIR as _WINDIR
 
 name = "prefetch"
 display_name = "Prefetch Files"
 description = "Windows Prefetch cache files (.pf) — auto-regenerated on use"
 risk = RiskLevel.LOW
 
+_PREFETCH_DIR = os.path.join(_WINDIR, "Prefetch")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -23,19 +26,16 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    prefetch_dir = os.path.join(windir, "Prefetch")
-
-    if not os.path.isdir(prefetch_dir):
+    if not os.path.isdir(_PREFETCH_DIR):
         return category
 
     try:
-        for entry in os.scandir(prefetch_dir):
+        for entry in os.scandir(_PREFETCH_DIR):
             try:
                 if entry.is_file(follow_symlinks=False) and entry.name.lower().endswith(".pf"):
                     category.items.append(CleanupItem(
                         path=entry.path,
-                        size=entry.stat().st_size,
+                        size=entry.stat(follow_symlinks=False).st_size,
                         category=category.name,
                         risk=risk,
                         item_type=ItemType.FILE,
@@ -5,15 +5,24 @@ Scans $Recycle.Bin on all available drives.
 
 from __future__ import annotations
 
+import ctypes
 import os
 import string
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size
 
 name = "recycle_bin"
 display_name = "Recycle Bin"
 description = "Deleted files in the Recycle Bin on all drives"
 risk = RiskLevel.SAFE
 
+# GetDriveTypeW results for drives that are never probed
+DRIVE_REMOTE = 4
+DRIVE_CDROM = 5
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -22,37 +31,54 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    # Iterate all drive letters
-    for letter in string.ascii_uppercase:
+    # Collect the Recycle Bin folder of every present drive
+    bins = []
+    for letter in _present_drive_letters():
         drive = f"{letter}:\\"
-        if not os.path.isdir(drive):
-            continue
-
         recycle_path = os.path.join(drive, "$Recycle.Bin")
         if os.path.isdir(recycle_path):
-            size = _dir_size(recycle_path)
-            if size > 0:
-                category.items.append(CleanupItem(
-                    path=recycle_path,
-                    size=size,
-                    category=category.name,
-                    risk=risk,
-                    item_type=ItemType.DIRECTORY,
-                    description=f"Recycle Bin ({letter}:)",
-                ))
+            bins.append((letter, recycle_path))
+
+    if not bins:
+        return category
+
+    # Each drive is an independent device, so size them concurrently
+    with ThreadPoolExecutor(max_workers=len(bins)) as executor:
+        sizes = list(executor.map(_dir_size, [path for _, path in bins]))
+
+    for (letter, recycle_path), size in zip(bins, sizes):
+        if size > 0:
+            category.items.append(CleanupItem(
+                path=recycle_path,
+                size=size,
+                category=category.name,
+                risk=risk,
+                item_type=ItemType.DIRECTORY,
+                description=f"Recycle Bin ({letter}:)",
+            ))
 
     return category
 
 
-def _dir_size(path: str) -> int:
-    total = 0
+def _present_drive_letters() -> List[str]:
+    """
+    Letters of local fixed/removable drives, from the GetLogicalDrives
+    bitmask. Optical and network drives are skipped so they are not spun
+    up or waited on. Falls back to probing every letter when the Win32
+    API is unavailable.
+    """
     try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+        kernel32 = ctypes.windll.kernel32
+        mask = kernel32.GetLogicalDrives()
+    except (AttributeError, OSError):
+        return [letter for letter in string.ascii_uppercase
+                if os.path.isdir(f"{letter}:\\")]
+
+    letters = []
+    for i, letter in enumerate(string.ascii_uppercase):
+        if not mask & (1 << i):
+            continue
+        if kernel32.GetDriveTypeW(f"{letter}:\\") in (DRIVE_REMOTE, DRIVE_CDROM):
+            continue
+        letters.append(letter)
+    return letters
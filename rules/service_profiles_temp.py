@@ -8,12 +8,22 @@ from __future__ import annotations
 
 import os
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size, WINDIR as _WINDIR
 
 name = "service_profiles_temp"
 display_name = "Service Profiles Temp"
 description = "Temp files in LocalService & NetworkService profiles (often 10-60+ GB)"
 risk = RiskLevel.SAFE
 
+# (temp dir, label) for each service profile
+_PROFILE_TEMP_DIRS = [
+    (os.path.join(_WINDIR, "ServiceProfiles", profile_name, "AppData", "Local", "Temp"), label)
+    for profile_name, label in (
+        ("LocalService", "Local Service temp files"),
+        ("NetworkService", "Network Service temp files"),
+    )
+]
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -22,18 +32,7 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-
-    profiles = [
-        ("LocalService", "Local Service temp files"),
-        ("NetworkService", "Network Service temp files"),
-    ]
-
-    for profile_name, label in profiles:
-        temp_dir = os.path.join(
-            windir, "ServiceProfiles", profile_name,
-            "AppData", "Local", "Temp",
-        )
+    for temp_dir, label in _PROFILE_TEMP_DIRS:
         if not os.path.isdir(temp_dir):
             continue
 
@@ -44,7 +43,7 @@ def scan() -> CleanupCategory:
                     if entry.is_file(follow_symlinks=False):
                         category.items.append(CleanupItem(
                             path=entry.path,
-                            size=entry.stat().st_size,
+                            size=entry.stat(follow_symlinks=False).st_size,
                             category=category.name,
                             risk=risk,
                             item_type=ItemType.FILE,
@@ -66,17 +65,3 @@ def scan() -> CleanupCategory:
             pass
 
     return category
-
-
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
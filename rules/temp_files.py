@@ -7,15 +7,23 @@ from __future__ import annotations
 
 import os
 import glob
-from pathlib import Path
+from typing import List, Tuple
 
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size, USERPROFILE as _USERPROFILE, WINDIR as _WINDIR
 
 name = "temp_files"
 display_name = "Temporary Files"
 description = "User and system temporary files (%TEMP%, Windows\\Temp)"
 risk = RiskLevel.SAFE
 
+_USER_TEMP = os.environ.get("TEMP", os.path.join(_USERPROFILE, "AppData", "Local", "Temp"))
+_SYS_TEMP = os.path.join(_WINDIR, "Temp")
+# The system temp dir is skipped when %TEMP% already points at it
+_SYS_TEMP_IS_USER_TEMP = (
+    os.path.normpath(_SYS_TEMP).lower() == os.path.normpath(_USER_TEMP).lower()
+)
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -25,13 +33,11 @@ def scan() -> CleanupCategory:
     )
 
     # User temp directory
-    user_temp = os.environ.get("TEMP", os.path.join(os.environ.get("USERPROFILE", ""), "AppData", "Local", "Temp"))
-    _scan_temp_dir(category, user_temp, "User temp")
+    _scan_temp_dir(category, _USER_TEMP, "User temp")
 
     # System temp directory
-    sys_temp = os.path.join(os.environ.get("SYSTEMROOT", r"C:\Windows"), "Temp")
-    if os.path.normpath(sys_temp).lower() != os.path.normpath(user_temp).lower():
-        _scan_temp_dir(category, sys_temp, "System temp")
+    if not _SYS_TEMP_IS_USER_TEMP:
+        _scan_temp_dir(category, _SYS_TEMP, "System temp")
 
     return category
 
@@ -41,45 +47,32 @@ def _scan_temp_dir(category: CleanupCategory, temp_dir: str, label: str) -> None
     if not os.path.isdir(temp_dir):
         return
 
+    file_desc = f"{label} file"
+    dir_desc = f"{label} folder"
+
+    # (path, size, type, description) rows, turned into CleanupItems at the end
+    rows: List[Tuple[str, int, ItemType, str]] = []
+    append = rows.append
     try:
         for entry in os.scandir(temp_dir):
             try:
                 if entry.is_file(follow_symlinks=False):
-                    size = entry.stat().st_size
-                    category.items.append(CleanupItem(
-                        path=entry.path,
-                        size=size,
-                        category=category.name,
-                        risk=risk,
-                        item_type=ItemType.FILE,
-                        description=f"{label} file",
-                    ))
+                    append((entry.path, entry.stat(follow_symlinks=False).st_size, ItemType.FILE, file_desc))
                 elif entry.is_dir(follow_symlinks=False):
-                    size = _dir_size(entry.path)
-                    category.items.append(CleanupItem(
-                        path=entry.path,
-                        size=size,
-                        category=category.name,
-                        risk=risk,
-                        item_type=ItemType.DIRECTORY,
-                        description=f"{label} folder",
-                    ))
+                    append((entry.path, _dir_size(entry.path), ItemType.DIRECTORY, dir_desc))
             except (OSError, PermissionError):
                 pass
     except (OSError, PermissionError):
         pass
 
-
-def _dir_size(path: str) -> int:
-    """Calculate total directory size."""
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=item_type,
+            description=desc,
+        )
+        for path, size, item_type, desc in rows
+    )
@@ -6,13 +6,18 @@ Scans C:\\Windows\\SoftwareDistribution\\Download for cached update files.
 from __future__ import annotations
 
 import os
+from typing import List, Tuple
+
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import dir_size as _dir_size, WINDIR as _WINDIR
 
 name = "windows_update"
 display_name = "Windows Update Cache"
 description = "Downloaded Windows Update files (SoftwareDistribution\\Download)"
 risk = RiskLevel.SAFE
 
+_DOWNLOAD_DIR = os.path.join(_WINDIR, "SoftwareDistribution", "Download")
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -21,51 +26,36 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
-    windir = os.environ.get("SYSTEMROOT", r"C:\Windows")
-    download_dir = os.path.join(windir, "SoftwareDistribution", "Download")
-
-    if not os.path.isdir(download_dir):
+    if not os.path.isdir(_DOWNLOAD_DIR):
         return category
 
+    # (path, size, type, description) rows, turned into CleanupItems at the end
+    rows: List[Tuple[str, int, ItemType, str]] = []
+    append = rows.append
     try:
-        for entry in os.scandir(download_dir):
+        for entry in os.scandir(_DOWNLOAD_DIR):
             try:
                 if entry.is_file(follow_symlinks=False):
-                    category.items.append(CleanupItem(
-                        path=entry.path,
-                        size=entry.stat().st_size,
-                        category=category.name,
-                        risk=risk,
-                        item_type=ItemType.FILE,
-                        description="Windows Update download",
-                    ))
+                    append((entry.path, entry.stat(follow_symlinks=False).st_size, ItemType.FILE,
+                            "Windows Update download"))
                 elif entry.is_dir(follow_symlinks=False):
-                    size = _dir_size(entry.path)
-                    category.items.append(CleanupItem(
-                        path=entry.path,
-                        size=size,
-                        category=category.name,
-                        risk=risk,
-                        item_type=ItemType.DIRECTORY,
-                        description="Windows Update download folder",
-                    ))
+                    append((entry.path, _dir_size(entry.path), ItemType.DIRECTORY,
+                            "Windows Update download folder"))
             except (OSError, PermissionError):
                 pass
     except (OSError, PermissionError):
         pass
 
-    return category
-
+    category.items.extend(
+        CleanupItem(
+            path=path,
+            size=size,
+            category=category.name,
+            risk=risk,
+            item_type=item_type,
+            description=desc,
+        )
+        for path, size, item_type, desc in rows
+    )
 
-def _dir_size(path: str) -> int:
-    total = 0
-    try:
-        for dirpath, _, filenames in os.walk(path):
-            for f in filenames:
-                try:
-                    total += os.path.getsize(os.path.join(dirpath, f))
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    return category
@@ -9,16 +9,36 @@ The only safe approach is to delegate to DISM.exe.
 
 from __future__ import annotations
 
+import json
 import os
+import re
 import subprocess
+import sys
+import time
+from typing import Optional
 
 from models import CleanupCategory, CleanupItem, RiskLevel, ItemType
+from rules._fsutil import (
+    LOCALAPPDATA as _LOCALAPPDATA,
+    WINDIR as _WINDIR,
+    is_admin as _is_admin,
+)
 
 name = "winsxs_cleanup"
 display_name = "WinSxS Component Store"
 description = "Superseded Windows components (cleaned via DISM)"
 risk = RiskLevel.MEDIUM
 
+# How long a DISM analysis result is reused before DISM is run again
+DISM_CACHE_TTL_S = 6 * 60 * 60
+
+_DISM_CACHE_FILE = os.path.join(_LOCALAPPDATA or ".", "SysClean", "dism_cache.json")
+_WINSXS_DIR = os.path.join(_WINDIR, "WinSxS")
+
+# "<label> : 1.25 GB" — number (either decimal separator) and unit after the colon
+_SIZE_RE = re.compile(r":\s*([\d.,]+)\s*(bytes|B|KB|MB|GB|TB)\b", re.IGNORECASE)
+_MULT = {"B": 1, "BYTES": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
+
 
 def scan() -> CleanupCategory:
     category = CleanupCategory(
@@ -27,6 +47,12 @@ def scan() -> CleanupCategory:
         risk=risk,
     )
 
+    # DISM refuses /Online servicing without elevation; skip the (up to
+    # 120 s) analysis instead of waiting for it to fail
+    if not _is_admin():
+        category.scan_error = "requires administrator"
+        return category
+
     # Run DISM AnalyzeComponentStore to get reclaimable size
     reclaimable = _analyze_component_store()
 
@@ -50,23 +76,90 @@ def _analyze_component_store() -> int:
     """
     Run DISM /AnalyzeComponentStore and parse the reclaimable space.
 
-    Returns estimated reclaimable bytes, or 0 if analysis fails.
+    Returns estimated reclaimable bytes, or 0 if analysis fails. A recent
+    result cached on disk is reused instead of re-running DISM.
     """
+    cached = _load_cached_reclaimable()
+    if cached is not None:
+        return cached
+
     try:
         result = subprocess.run(
             ["Dism.exe", "/Online", "/Cleanup-Image", "/AnalyzeComponentStore"],
             capture_output=True,
-            text=True,
             timeout=120,
         )
         if result.returncode != 0:
             return 0
 
-        return _parse_reclaimable(result.stdout)
+        # The size lines are plain ASCII; decoding as such sidesteps the
+        # console code page and drops localized characters we don't parse
+        reclaimable = _parse_reclaimable(result.stdout.decode("ascii", errors="ignore"))
 
     except (subprocess.TimeoutExpired, OSError, PermissionError):
         return 0
 
+    _save_cached_reclaimable(reclaimable)
+    return reclaimable
+
+
+# ── DISM result cache ────────────────────────────────────────────────────────
+
+def _cache_key() -> dict:
+    """
+    Values that must match for a cached result to be reused: the Windows
+    build, and the WinSxS mtime, which changes when components are added
+    or removed (updates installed, StartComponentCleanup run).
+    """
+    try:
+        build = sys.getwindowsversion().build
+    except AttributeError:
+        build = 0
+    try:
+        winsxs_mtime_ns = os.stat(_WINSXS_DIR).st_mtime_ns
+    except (OSError, PermissionError):
+        winsxs_mtime_ns = 0
+    return {"build": build, "winsxs_mtime_ns": winsxs_mtime_ns}
+
+
+def _load_cached_reclaimable() -> Optional[int]:
+    """Return the cached reclaimable bytes if still valid, else None."""
+    try:
+        with open(_DISM_CACHE_FILE, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (json.JSONDecodeError, UnicodeDecodeError, OSError, PermissionError):
+        return None
+
+    # The file is ours but lives in a user-writable folder; treat anything
+    # that isn't the shape _save_cached_reclaimable writes as a cache miss
+    if not isinstance(data, dict):
+        return None
+    timestamp = data.get("timestamp")
+    reclaimable = data.get("reclaimable_bytes")
+    if (not isinstance(timestamp, (int, float)) or isinstance(timestamp, bool)
+            or not isinstance(reclaimable, int) or isinstance(reclaimable, bool)
+            or reclaimable < 0):
+        return None
+
+    if time.time() - timestamp > DISM_CACHE_TTL_S:
+        return None
+    for key, value in _cache_key().items():
+        if data.get(key) != value:
+            return None
+
+    return reclaimable
+
+
+def _save_cached_reclaimable(reclaimable: int) -> None:
+    """Persist a fresh DISM analysis result."""
+    try:
+        os.makedirs(os.path.dirname(_DISM_CACHE_FILE), exist_ok=True)
+        data = dict(_cache_key(), timestamp=time.time(), reclaimable_bytes=reclaimable)
+        with open(_DISM_CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    except (OSError, PermissionError):
+        pass
+
 
 def _parse_reclaimable(output: str) -> int:
     """
@@ -83,16 +176,25 @@ def _parse_reclaimable(output: str) -> int:
     """
     cleanup_recommended = False
     reclaimable_bytes = 0
+    seen_recommended = seen_backups = False
 
     for line in output.splitlines():
         line_stripped = line.strip()
 
-        if "Component Store Cleanup Recommended" in line_stripped:
-            if "Yes" in line_stripped:
-                cleanup_recommended = True
-
-        if "Backups and Disabled Features" in line_stripped:
-            reclaimable_bytes = _parse_size_value(line_stripped)
+        # Cheap prefix test first; these are the only two lines we need
+        if line_stripped.startswith("Backups"):
+            if "Backups and Disabled Features" in line_stripped:
+                reclaimable_bytes = _parse_size_value(line_stripped)
+                seen_backups = True
+        elif line_stripped.startswith("Component Store Cleanup"):
+            if "Component Store Cleanup Recommended" in line_stripped:
+                cleanup_recommended = "Yes" in line_stripped
+                seen_recommended = True
+        else:
+            continue
+
+        if seen_backups and seen_recommended:
+            break
 
     # If cleanup is recommended but we couldn't parse a size, estimate 1 GB
     if cleanup_recommended and reclaimable_bytes == 0:
@@ -106,18 +208,10 @@ def _parse_size_value(line: str) -> int:
     Parse a DISM size line like "Backups and Disabled Features : 1.25 GB"
     Returns bytes.
     """
+    m = _SIZE_RE.search(line)
+    if not m:
+        return 0
     try:
-        # Split on ":" and take the value part
-        _, value_part = line.rsplit(":", 1)
-        value_part = value_part.strip()
-
-        # Try to extract number and unit
-        parts = value_part.split()
-        if len(parts) >= 2:
-            number = float(parts[0].replace(",", "."))
-            unit = parts[1].upper()
-            multipliers = {"B": 1, "KB": 1024, "MB": 1024**2, "GB": 1024**3, "TB": 1024**4}
-            return int(number * multipliers.get(unit, 1))
-    except (ValueError, IndexError):
-        pass
-    return 0
+        return int(float(m.group(1).replace(",", ".")) * _MULT[m.group(2).upper()])
+    except ValueError:
+        return 0
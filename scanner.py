@@ -7,127 +7,172 @@ from __future__ import annotations
 import os
 import time
 import traceback
-from pathlib import Path
-from typing import Callable, List, Optional
-import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, FrozenSet, List, Optional, Tuple
 
 from models import CleanupCategory, ScanResult
 from rules import ALL_RULES
+from rules._fsutil import clear_dir_size_cache, dir_size as _dir_size
 
 
 ProgressCallback = Optional[Callable[[str, int, int], None]]
 # callback(category_name, current_index, total_categories)
 
+# Upper bound on rules scanned concurrently
+MAX_SCAN_WORKERS = 8
+
+# Minimum seconds between progress callbacks while no rule has finished
+PROGRESS_MIN_INTERVAL_S = 0.5
+
+# Rule selections for the common (non-profile) scans, built once
+_RULES_ALL = tuple(ALL_RULES)
+_RULES_NO_REG = tuple(r for r in ALL_RULES if r.name != "registry")
+
 
 def get_dir_size(path: str) -> int:
-    """Recursively calculate directory size in bytes, handling permission errors."""
-    total = 0
-    try:
-        for dirpath, _dirnames, filenames in os.walk(path):
-            for f in filenames:
-                fp = os.path.join(dirpath, f)
-                try:
-                    total += os.path.getsize(fp)
-                except (OSError, PermissionError):
-                    pass
-    except (OSError, PermissionError):
-        pass
-    return total
+    """
+    Recursively calculate directory size in bytes, handling permission errors.
+
+    Uses the same scandir-based, cached walker as the rule modules, so
+    sizes come from DirEntry data instead of an os.walk plus a getsize
+    call per file. The cache lives until the next scan_all, so a size
+    taken after files changed deep inside `path` may be stale until then.
+    """
+    return _dir_size(path)
 
 
 def get_file_size(path: str) -> int:
-    """Get file size, returning 0 on error."""
+    """Get file size (without following symlinks), returning 0 on error."""
     try:
-        return os.path.getsize(path)
+        return os.stat(path, follow_symlinks=False).st_size
     except (OSError, PermissionError):
         return 0
 
 
+def _scan_rule(rule_module, debug: bool = False) -> Tuple[Optional[CleanupCategory], Optional[str], float]:
+    """
+    Run a single rule on a worker thread.
+
+    Returns (category, error, duration_s). The error is repr() of the
+    exception, or the full formatted traceback when `debug` is set.
+    """
+    rule_start = time.perf_counter()
+    try:
+        category = rule_module.scan()
+    except Exception as e:
+        error = traceback.format_exc() if debug else repr(e)
+        return None, error, time.perf_counter() - rule_start
+    return category, None, time.perf_counter() - rule_start
+
+
 def scan_all(
     include_registry: bool = False,
     progress_cb: ProgressCallback = None,
-    profile_rules: Optional[set] = None,
+    profile_rules: Optional[FrozenSet[str]] = None,
+    debug: bool = False,
 ) -> ScanResult:
     """
     Run all enabled cleanup rules and return aggregated results.
 
+    Rules are dispatched to a ThreadPoolExecutor; categories are returned
+    in rule order regardless of which rule finishes first. Rules spend
+    their time in filesystem, registry and subprocess calls that release
+    the GIL. The dir_size cache is cleared first, so rules share sizes
+    within this scan but never reuse ones from an earlier scan.
+
     Args:
         include_registry: If True, include registry analysis rules.
         progress_cb: Optional callback for progress reporting.
         profile_rules: If provided, only run rules whose `name` is in this set.
+        debug: If True, record full tracebacks for failed rules instead of
+            just the exception repr.
 
     Returns:
         ScanResult with all discovered cleanup items grouped by category.
     """
     result = ScanResult()
+    clear_dir_size_cache()
 
     if profile_rules is not None:
-        rules = [r for r in ALL_RULES if r.name in profile_rules]
+        rules = tuple(r for r in _RULES_ALL if r.name in profile_rules)
     else:
-        rules = [r for r in ALL_RULES if include_registry or r.name != "registry"]
+        rules = _RULES_ALL if include_registry else _RULES_NO_REG
 
     total = len(rules)
     scan_start = time.perf_counter()
 
-    def emit_progress(label: str, completed_count: int):
+    last_emit = [0.0]
+
+    def emit_progress(label: str, completed_count: int, force: bool = True):
         if not progress_cb:
             return
-        elapsed = time.perf_counter() - scan_start
+        now = time.perf_counter()
+        if not force and now - last_emit[0] < PROGRESS_MIN_INTERVAL_S:
+            return
+        last_emit[0] = now
+        elapsed = now - scan_start
         divisor = completed_count if completed_count > 0 else 1
         avg_per_rule = elapsed / divisor
         remaining = avg_per_rule * max(total - completed_count, 0)
         progress_cb(label, completed_count, total, elapsed, remaining)
 
-    for idx, rule_module in enumerate(rules):
-        label = f"{rule_module.display_name} ({idx + 1}/{total})"
-        emit_progress(label, idx)
-
-        rule_start = time.perf_counter()
-        result_holder: dict[str, CleanupCategory] = {}
-        error_holder: dict[str, str] = {}
-
-        def _run_rule() -> None:
-            try:
-                category = rule_module.scan()
-                if category:
-                    result_holder["category"] = category
-            except Exception:
-                error_holder["trace"] = traceback.format_exc()
-
-        worker = threading.Thread(
-            target=_run_rule,
-            name=f"SysCleanRule-{rule_module.name}",
-            daemon=True,
-        )
-        worker.start()
-
-        while worker.is_alive():
-            worker.join(timeout=0.2)
-            if worker.is_alive():
-                emit_progress(label, idx)
-
-        worker.join()
-        rule_duration = time.perf_counter() - rule_start
-
-        if error_holder:
-            error_cat = CleanupCategory(
-                name=rule_module.display_name,
-                description=rule_module.description,
-                risk=rule_module.risk,
-                scan_error=error_holder["trace"],
-                scan_duration_s=rule_duration,
-            )
-            result.categories.append(error_cat)
-            emit_progress(f"{rule_module.display_name} ✗ ({idx + 1}/{total})", idx + 1)
-            continue
-
-        category = result_holder.get("category")
-        if category:
-            category.scan_duration_s = rule_duration
-            if category.item_count > 0:
-                result.categories.append(category)
-
-        emit_progress(f"{rule_module.display_name} ✓ ({idx + 1}/{total})", idx + 1)
+    # Rules walk disjoint trees, so run them side by side on worker threads;
+    # each result lands in its rule's slot so the output keeps rule order
+    slots: List[Optional[CleanupCategory]] = [None] * total
+    completed_count = 0
+    label = f"Scanning {total} rules"
+    emit_progress(label, 0)
+
+    if rules:
+        max_workers = min(MAX_SCAN_WORKERS, total)
+        with ThreadPoolExecutor(max_workers=max_workers,
+                                thread_name_prefix="SysCleanScan") as executor:
+            futures = {
+                executor.submit(_scan_rule, rule_module, debug): idx
+                for idx, rule_module in enumerate(rules)
+            }
+            pending = set(futures)
+
+            while pending:
+                done, pending = wait(pending, timeout=0.2, return_when=FIRST_COMPLETED)
+                if not done:
+                    # Only refreshes the elapsed/ETA readout, so throttle it
+                    emit_progress(label, completed_count, force=False)
+                    continue
+
+                for future in done:
+                    idx = futures[future]
+                    rule_module = rules[idx]
+                    completed_count += 1
+
+                    try:
+                        category, error, rule_duration = future.result()
+                    except Exception as e:
+                        error = traceback.format_exc() if debug else repr(e)
+                        category, rule_duration = None, 0.0
+
+                    if error:
+                        slots[idx] = CleanupCategory(
+                            name=rule_module.display_name,
+                            description=rule_module.description,
+                            risk=rule_module.risk,
+                            scan_error=error,
+                            scan_duration_s=rule_duration,
+                        )
+                        label = f"{rule_module.display_name} ✗ ({completed_count}/{total})"
+                    else:
+                        if category:
+                            category.scan_duration_s = rule_duration
+                            # Keep empty categories only when the rule flagged
+                            # why it could not scan
+                            if category.item_count > 0 or category.scan_error:
+                                slots[idx] = category
+                        label = f"{rule_module.display_name} ✓ ({completed_count}/{total})"
+
+                    emit_progress(label, completed_count)
+
+    # Slots are in rule order regardless of completion order
+    result.categories = [c for c in slots if c is not None]
 
     result.total_scan_duration_s = time.perf_counter() - scan_start
 
@@ -0,0 +1,74 @@
+"""
+Tests for parsing and ordering pnputil /enum-drivers output.
+"""
+
+from __future__ import annotations
+
+import unittest
+
+from rules.driver_store_cleanup import _driver_sort_key, _parse_pnputil_output
+
+# `pnputil /enum-drivers` output as printed by current Windows 10/11 builds
+PNPUTIL_OUTPUT = """\
+Microsoft PnP Utility
+
+Published Name:     oem12.inf
+Original Name:      nv_dispi.inf
+Provider Name:      NVIDIA
+Class Name:         Display adapters
+Class GUID:         {4d36e968-e325-11ce-bfc1-08002be10318}
+Driver Version:     06/12/2023 31.0.15.3623
+Signer Name:        Microsoft Windows Hardware Compatibility Publisher
+
+Published Name:     oem31.inf
+Original Name:      nv_dispi.inf
+Provider Name:      NVIDIA
+Class Name:         Display adapters
+Class GUID:         {4d36e968-e325-11ce-bfc1-08002be10318}
+Driver Version:     01/15/2024 31.0.15.4601
+Signer Name:        Microsoft Windows Hardware Compatibility Publisher
+
+Published Name:     oem7.inf
+Original Name:      nv_dispi.inf
+Provider Name:      NVIDIA
+Class Name:         Display adapters
+Class GUID:         {4d36e968-e325-11ce-bfc1-08002be10318}
+Driver Version:     11/02/2022 9.18.13.4174
+Signer Name:        Microsoft Windows Hardware Compatibility Publisher
+
+"""
+
+
+class ParsePnputilOutputTest(unittest.TestCase):
+
+    def test_splits_date_from_driver_version(self) -> None:
+        drivers = _parse_pnputil_output(PNPUTIL_OUTPUT.splitlines())
+        self.assertEqual(len(drivers), 3)
+        first = drivers[0]
+        self.assertEqual(first["published_name"], "oem12.inf")
+        self.assertEqual(first["original_name"], "nv_dispi.inf")
+        self.assertEqual(first["version"], "31.0.15.3623")
+        self.assertEqual(first["date"], "06/12/2023")
+
+    def test_legacy_version_and_date_label(self) -> None:
+        drivers = _parse_pnputil_output([
+            "Published Name : oem3.inf",
+            "Driver Version and Date : 04/21/2009 6.1.7600.16385",
+        ])
+        self.assertEqual(drivers[0]["version"], "6.1.7600.16385")
+        self.assertEqual(drivers[0]["date"], "04/21/2009")
+
+    def test_newest_version_sorts_first(self) -> None:
+        drivers = _parse_pnputil_output(PNPUTIL_OUTPUT.splitlines())
+        drivers.sort(key=_driver_sort_key, reverse=True)
+        self.assertEqual([d["published_name"] for d in drivers],
+                         ["oem31.inf", "oem12.inf", "oem7.inf"])
+
+    def test_date_breaks_version_ties(self) -> None:
+        older = {"version": "1.2.3.4", "date": "12/01/2022"}
+        newer = {"version": "1.2.3.4", "date": "01/05/2023"}
+        self.assertGreater(_driver_sort_key(newer), _driver_sort_key(older))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,124 @@
+"""
+Tests for the shared rule filesystem helpers.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+
+from rules._fsutil import (
+    clear_dir_size_cache,
+    dir_size,
+    find_project_roots,
+    walk_files,
+    walk_project_tree,
+)
+
+
+class WalkFilesTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _write(self, rel_path: str, size: int) -> None:
+        path = os.path.join(self.root, rel_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(b"x" * size)
+
+    def test_walks_every_file_in_a_wide_deep_tree(self) -> None:
+        expected = {}
+        for i in range(40):
+            for j in range(5):
+                rel = os.path.join(f"d{i}", f"s{j}", f"f{i}_{j}.log")
+                self._write(rel, 5)
+                expected[os.path.join(self.root, rel)] = 5
+        self._write("top.txt", 7)
+        expected[os.path.join(self.root, "top.txt")] = 7
+
+        for _ in range(20):
+            seen = {entry.path: size for entry, size in walk_files(self.root)}
+            self.assertEqual(seen, expected)
+
+    def test_dir_size_counts_all_bytes(self) -> None:
+        for i in range(100):
+            self._write(os.path.join(f"d{i % 20}", f"n{i}", "f.bin"), 10)
+        self.assertEqual(dir_size(self.root), 1000)
+
+    def test_clearing_the_cache_picks_up_deep_changes(self) -> None:
+        self._write(os.path.join("a", "b", "f.bin"), 10)
+        self.assertEqual(dir_size(self.root), 10)
+
+        # The root's mtime does not change, so only a cleared cache sees this
+        self._write(os.path.join("a", "b", "g.bin"), 5)
+        clear_dir_size_cache()
+        self.assertEqual(dir_size(self.root), 15)
+
+    def test_missing_directory_is_empty(self) -> None:
+        missing = os.path.join(self.root, "nope")
+        self.assertEqual(list(walk_files(missing)), [])
+        self.assertEqual(dir_size(missing), 0)
+
+
+class WalkProjectTreeTest(unittest.TestCase):
+
+    def test_prunes_hidden_skipped_and_deep_dirs(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            for rel in ("app/src/deep/deeper", "app/.git/objects", "app/dist/js",
+                        "app/cache/inner", "lib"):
+                os.makedirs(os.path.join(root, rel))
+
+            visited = []
+            for dirpath, dirnames, _filenames in walk_project_tree(root, 2, {"dist"}):
+                visited.append(os.path.relpath(dirpath, root))
+                if "cache" in dirnames:
+                    dirnames.remove("cache")  # caller-side pruning
+
+            self.assertEqual(sorted(visited), sorted([
+                ".", "app", "lib", os.path.join("app", "src"),
+            ]))
+
+
+class FindProjectRootsTest(unittest.TestCase):
+
+    def test_returns_existing_candidates_in_order(self) -> None:
+        with tempfile.TemporaryDirectory() as profile:
+            os.mkdir(os.path.join(profile, "code"))
+            os.mkdir(os.path.join(profile, "Projects"))
+            open(os.path.join(profile, "Repos"), "w").close()  # a file, not a folder
+
+            roots = find_project_roots(profile, ["Projects", "Repos", "Code", "dev"])
+            self.assertEqual(roots, [os.path.join(profile, "Projects"),
+                                     os.path.join(profile, "code")])
+
+    def test_follows_links_and_drops_duplicates(self) -> None:
+        with tempfile.TemporaryDirectory() as profile:
+            os.mkdir(os.path.join(profile, "Projects"))
+            target = os.path.join(profile, "elsewhere")
+            os.mkdir(target)
+            try:
+                # "dev" is junctioned to another folder, "source" back to Projects
+                os.symlink(target, os.path.join(profile, "dev"), target_is_directory=True)
+                os.symlink(os.path.join(profile, "Projects"), os.path.join(profile, "source"),
+                           target_is_directory=True)
+            except (OSError, NotImplementedError):
+                self.skipTest("no symlink privilege")
+
+            roots = find_project_roots(profile, ["Projects", "dev", "source"])
+            self.assertEqual(roots, [os.path.join(profile, "Projects"),
+                                     os.path.join(profile, "dev")])
+
+    def test_missing_profile_has_no_roots(self) -> None:
+        with tempfile.TemporaryDirectory() as parent:
+            missing = os.path.join(parent, "missing")
+            self.assertEqual(find_project_roots(missing, ["Projects"]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,11 +7,14 @@ with Rich panels and tables for summaries and reports.
 
 from __future__ import annotations
 
+import heapq
 import os
 import sys
+from functools import lru_cache
+from operator import attrgetter
 from typing import List, Optional
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
@@ -38,18 +41,66 @@ RISK_COLORS = {
     RiskLevel.REGISTRY: "magenta",
 }
 
+# Pre-styled risk cells for tables, so rows don't go through markup parsing
+_RISK_CELL = {
+    level: Text(f"[{RISK_TAGS.get(level, level.value)}]",
+                style=RISK_COLORS.get(level, "white"))
+    for level in RiskLevel
+}
+
+# Most items offered in one per-category review prompt (largest first)
+MAX_REVIEW_ITEMS = 500
+
+_ITEM_TYPE_LABEL = {
+    ItemType.DIRECTORY: "DIR",
+    ItemType.REGISTRY_KEY: "REG",
+    ItemType.FILE: "FILE",
+}
+
+
+# ── Label builders ───────────────────────────────────────────────────────────
+# Pure functions of their arguments, so going "back" and re-entering a
+# prompt reuses the labels built the first time. The caches are bounded to
+# about one category screen and a couple of review prompts' worth of labels.
+
+@lru_cache(maxsize=128)
+def _category_label(name: str, risk: RiskLevel, item_count: int, total_size: int) -> str:
+    tag = RISK_TAGS.get(risk, "?")
+    return f"{name:<38s}  {item_count:>5,} items  {_format_size(total_size):>10s}  [{tag}]"
+
+
+@lru_cache(maxsize=2 * MAX_REVIEW_ITEMS)
+def _item_label(path: str, size: int, item_type: ItemType) -> str:
+    # Keyed on the raw size so a cache hit skips the size formatting too
+    type_label = _ITEM_TYPE_LABEL.get(item_type, "FILE")
+    size_human = _format_size(size)
+    # Shorten path for display
+    display_path = path
+    if len(display_path) > 60:
+        display_path = "..." + display_path[-57:]
+    return f"{display_path:<63s}  {size_human:>10s}  {type_label}"
+
 
 def show_scan_summary(result: ScanResult) -> None:
     """Display a summary panel after scanning."""
-    console.print()
-    console.print(Panel.fit(
-        f"[bold cyan]Scan Complete[/]\n"
-        f"Found [bold]{result.total_items:,}[/] items across "
-        f"[bold]{len(result.categories)}[/] categories\n"
-        f"Total reclaimable space: [bold green]{result.total_size_human}[/]",
-        border_style="cyan",
-    ))
-    console.print()
+    if not console.is_terminal:
+        # Piped/redirected: the panel's styling would be stripped anyway
+        print(f"Scan complete: {result.total_items:,} items in "
+              f"{len(result.categories)} categories, "
+              f"{result.total_size_human} reclaimable")
+        return
+
+    # Buffer the block so it reaches the terminal in one write
+    with console:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold cyan]Scan Complete[/]\n"
+            f"Found [bold]{result.total_items:,}[/] items across "
+            f"[bold]{len(result.categories)}[/] categories\n"
+            f"Total reclaimable space: [bold green]{result.total_size_human}[/]",
+            border_style="cyan",
+        ))
+        console.print()
 
 
 def select_categories(result: ScanResult) -> bool:
@@ -62,13 +113,9 @@ def select_categories(result: ScanResult) -> bool:
     for cat in result.categories:
         if cat.scan_error:
             continue
-        tag = RISK_TAGS.get(cat.risk, "?")
-        label = (
-            f"{cat.name:<38s}  {cat.item_count:>5,} items  "
-            f"{cat.total_size_human:>10s}  [{tag}]"
-        )
         choices.append({
-            "name": label,
+            "name": _category_label(cat.name, cat.risk, cat.item_count,
+                                    cat.total_size),
             "value": cat.name,
             "enabled": cat.enabled,
         })
@@ -77,9 +124,10 @@ def select_categories(result: ScanResult) -> bool:
         console.print("[yellow]No scannable categories found.[/]")
         return False
 
-    console.print("[bold cyan]Select categories to clean[/]")
-    console.print("[dim]  ↑/↓ navigate  ·  Space toggle  ·  "
-                  "Ctrl+A select all  ·  Enter confirm  ·  Ctrl+C cancel[/]\n")
+    with console:
+        console.print("[bold cyan]Select categories to clean[/]")
+        console.print("[dim]  ↑/↓ navigate  ·  Space toggle  ·  "
+                      "Ctrl+A select all  ·  Enter confirm  ·  Ctrl+C cancel[/]\n")
 
     try:
         selected = inquirer.checkbox(
@@ -96,8 +144,12 @@ def select_categories(result: ScanResult) -> bool:
 
     selected_set = set(selected)
 
+    enabled_categories = []
     for cat in result.categories:
         cat.enabled = cat.name in selected_set
+        if cat.enabled and not cat.scan_error:
+            enabled_categories.append(cat)
+    result.enabled_categories = enabled_categories
 
     if not selected_set:
         console.print("[red]No categories selected.[/]")
@@ -112,7 +164,7 @@ def review_items(result: ScanResult) -> bool:
 
     Returns True to proceed to confirmation, False to go back.
     """
-    selected_cats = [c for c in result.categories if c.enabled and not c.scan_error and c.item_count > 0]
+    selected_cats = [c for c in result.enabled_categories if c.item_count > 0]
 
     if not selected_cats:
         return True
@@ -142,29 +194,30 @@ def _review_category_items(cat: CleanupCategory) -> bool:
     if not items:
         return True
 
-    # Sort by size descending for better UX
-    sorted_items = sorted(items, key=lambda x: x.size, reverse=True)
+    # Sort by size descending for better UX. Huge categories only offer
+    # their largest items; a checkbox list of 10k entries is unusable and
+    # slow to render. Items not shown keep their current selection.
+    by_size = attrgetter("size")
+    if len(items) > MAX_REVIEW_ITEMS:
+        sorted_items = heapq.nlargest(MAX_REVIEW_ITEMS, items, key=by_size)
+    else:
+        sorted_items = sorted(items, key=by_size, reverse=True)
 
     choices = []
     for item in sorted_items:
-        type_label = "DIR" if item.item_type == ItemType.DIRECTORY else (
-            "REG" if item.item_type == ItemType.REGISTRY_KEY else "FILE"
-        )
-        # Shorten path for display
-        display_path = item.path
-        if len(display_path) > 60:
-            display_path = "..." + display_path[-57:]
-
-        label = f"{display_path:<63s}  {item.size_human:>10s}  {type_label}"
         choices.append({
-            "name": label,
+            "name": _item_label(item.path, item.size, item.item_type),
             "value": item.path,
             "enabled": item.selected,
         })
 
-    console.print(f"\n[bold cyan]{cat.name}[/] — "
-                  f"{cat.item_count:,} items, {cat.total_size_human}")
-    console.print("[dim]  ↑/↓ navigate  ·  Space toggle  ·  Enter confirm[/]\n")
+    with console:
+        console.print(f"\n[bold cyan]{cat.name}[/] — "
+                      f"{cat.item_count:,} items, {cat.total_size_human}")
+        if len(sorted_items) < len(items):
+            console.print(f"[dim]  Showing the largest {len(sorted_items):,} of "
+                          f"{len(items):,} items; the rest stay as selected.[/]")
+        console.print("[dim]  ↑/↓ navigate  ·  Space toggle  ·  Enter confirm[/]\n")
 
     try:
         selected = inquirer.checkbox(
@@ -180,20 +233,15 @@ def _review_category_items(cat: CleanupCategory) -> bool:
         return False
 
     selected_paths = set(selected)
-    for item in items:
+    for item in sorted_items:
         item.selected = item.path in selected_paths
+    cat.invalidate_selection()
 
     return True
 
 
-def confirm_deletion(result: ScanResult) -> bool:
-    """
-    Show final summary table and ask for confirmation.
-
-    Returns True if user confirms deletion, False to go back.
-    """
-    console.print()
-
+def _make_confirm_table() -> Table:
+    """Empty "Items Selected for Deletion" table with its columns set up."""
     table = Table(
         box=box.ROUNDED,
         title="Items Selected for Deletion",
@@ -204,53 +252,59 @@ def confirm_deletion(result: ScanResult) -> bool:
     table.add_column("Items", justify="right", width=8)
     table.add_column("Size", justify="right", width=12)
     table.add_column("Risk", justify="center", width=12)
+    return table
 
+
+def confirm_deletion(result: ScanResult) -> bool:
+    """
+    Show final summary table and ask for confirmation.
+
+    Returns True if user confirms deletion, False to go back.
+    """
+    console.print()
+
+    # Read each category's selection totals once, and skip building the
+    # table entirely when nothing is selected
+    rows = []
     total_items = 0
     total_size = 0
 
-    for cat in result.categories:
-        if not cat.enabled or cat.scan_error:
-            continue
-
-        sel_count = cat.selected_count
-        sel_size = cat.selected_size
+    for cat in result.enabled_categories:
+        sel_count, sel_size = cat.selection_totals()
         if sel_count == 0:
             continue
 
         total_items += sel_count
         total_size += sel_size
+        rows.append((cat, sel_count, sel_size))
 
-        risk_color = RISK_COLORS.get(cat.risk, "white")
-        risk_tag = RISK_TAGS.get(cat.risk, str(cat.risk.value))
+    if total_items == 0:
+        console.print("[yellow]No items selected for deletion.[/]")
+        return False
 
+    table = _make_confirm_table()
+    for cat, sel_count, sel_size in rows:
         table.add_row(
-            cat.name,
-            f"{sel_count:,}",
-            cat.selected_size_human,
-            f"[{risk_color}][{risk_tag}][/]",
+            Text(cat.name),
+            Text(f"{sel_count:,}"),
+            Text(_format_size(sel_size)),
+            _RISK_CELL[cat.risk],
         )
 
     table.add_section()
     table.add_row(
-        "[bold]TOTAL[/]",
-        f"[bold]{total_items:,}[/]",
-        f"[bold green]{_format_size(total_size)}[/]",
+        Text("TOTAL", style="bold"),
+        Text(f"{total_items:,}", style="bold"),
+        Text(_format_size(total_size), style="bold green"),
         "",
     )
 
-    console.print(table)
-    console.print()
-
-    if total_items == 0:
-        console.print("[yellow]No items selected for deletion.[/]")
-        return False
-
-    console.print(Panel(
+    console.print(Group(table, "", Panel(
         f"[bold red]WARNING: This will permanently delete {total_items:,} items "
         f"({_format_size(total_size)}).\n"
         f"Deleted files are NOT sent to the Recycle Bin and CANNOT be recovered.[/]",
         border_style="red",
-    ))
+    )))
 
     try:
         answer = inquirer.text(
@@ -274,19 +328,27 @@ def show_cleanup_report(
     duration_s: float = 0.0,
 ) -> None:
     """Display the final cleanup report."""
+    if not console.is_terminal:
+        # Piped/redirected: skip the markup and box layout
+        duration = f" Duration={_format_duration(duration_s)}" if duration_s > 0 else ""
+        print(f"Cleanup complete: Deleted={deleted:,} Failed={failed:,} "
+              f"Freed={_format_size(freed)}{duration} Log={log_path}")
+        return
+
     duration_line = ""
     if duration_s > 0:
         duration_line = f"\n  Duration: [bold cyan]{_format_duration(duration_s)}[/]"
 
-    console.print()
-    console.print(Panel.fit(
-        f"[bold green]Cleanup Complete![/]\n\n"
-        f"  Deleted:  [bold green]{deleted:,}[/] items\n"
-        f"  Failed:   [bold {'red' if failed else 'dim'}]{failed:,}[/] items\n"
-        f"  Freed:    [bold green]{_format_size(freed)}[/]"
-        f"{duration_line}\n\n"
-        f"  Log file: [cyan]{log_path}[/]",
-        border_style="green",
-        title="[bold]SysClean Report[/]",
-    ))
-    console.print()
+    with console:
+        console.print()
+        console.print(Panel.fit(
+            f"[bold green]Cleanup Complete![/]\n\n"
+            f"  Deleted:  [bold green]{deleted:,}[/] items\n"
+            f"  Failed:   [bold {'red' if failed else 'dim'}]{failed:,}[/] items\n"
+            f"  Freed:    [bold green]{_format_size(freed)}[/]"
+            f"{duration_line}\n\n"
+            f"  Log file: [cyan]{log_path}[/]",
+            border_style="green",
+            title="[bold]SysClean Report[/]",
+        ))
+        console.print()